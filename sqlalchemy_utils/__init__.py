@@ -54,7 +54,14 @@ from .listeners import (  # noqa
 )
 from .models import Timestamp  # noqa
 from .observer import observes  # noqa
-from .primitives import Country, Currency, WeekDay, WeekDays  # noqa
+from .primitives import (  # noqa
+    clear_locale_cache,
+    Country,
+    Currency,
+    prewarm_locale_cache,
+    WeekDay,
+    WeekDays
+)
 from .proxy_dict import proxy_dict, ProxyDict  # noqa
 from .query_chain import QueryChain  # noqa
 from .types import (  # noqa
@@ -74,6 +81,8 @@ from .types import (  # noqa
     InstrumentedList,
     IntRangeType,
     IPAddressType,
+    json_gin_index,
+    json_path_index,
     JSONType,
     LocaleType,
     NumericRangeType,
@@ -81,6 +90,7 @@ from .types import (  # noqa
     PasswordType,
     PhoneNumber,
     PhoneNumberType,
+    reencrypt,
     register_composites,
     remove_composite_listeners,
     ScalarListException,
@@ -88,6 +98,7 @@ from .types import (  # noqa
     TimezoneType,
     TSVectorType,
     URLType,
+    uuid7,
     UUIDType,
     WeekDaysType
 )
@@ -22,6 +22,28 @@ except ImportError:
         )
 
 
+_locales = {}
+_locale_identifiers = {}
+
+
+def parse_locale(identifier):
+    """
+    Return a babel Locale object for given locale identifier, for example
+    'en_US'. The identifier is parsed using `babel.Locale.parse` and the
+    Locale objects are interned, hence the locale data of each locale is
+    loaded only once.
+
+    :param identifier: locale identifier
+    """
+    try:
+        return _locales[identifier]
+    except KeyError:
+        locale = babel.Locale.parse(identifier)
+        locale = _locales.setdefault(str(locale), locale)
+        _locale_identifiers[id(locale)] = str(locale)
+        return _locales.setdefault(identifier, locale)
+
+
 def cast_locale(obj, locale):
     """
     Cast given locale to string. Supports also callbacks that return locales.
@@ -37,7 +59,11 @@ def cast_locale(obj, locale):
         except TypeError:
             locale = locale(obj)
     if isinstance(locale, babel.Locale):
-        return str(locale)
+        try:
+            # Interned locales are never freed, hence their ids are stable.
+            return _locale_identifiers[id(locale)]
+        except KeyError:
+            return str(locale)
     return locale
 
 
@@ -51,8 +77,20 @@ class cast_locale_expr(ColumnElement):
 def compile_cast_locale_expr(element, compiler, **kw):
     locale = cast_locale(element.cls, element.locale)
     if isinstance(locale, six.string_types):
-        return "'{0}'".format(locale)
-    return compiler.process(locale)
+        # Render locales always as plain string literals so that expressions
+        # compiled for queries match the expressions of functional indexes.
+        return "'{0}'".format(locale.replace("'", "''"))
+    return compiler.process(locale, **kw)
+
+
+def text_item(attr, key):
+    """
+    Return an expression that extracts given key of given translations column
+    as text. For JSON columns this uses the ``->>`` operator, for HSTORE
+    columns the ``->`` operator already returns text.
+    """
+    item = attr[key]
+    return getattr(item, 'astext', item)
 
 
 class TranslationHybrid(object):
@@ -73,6 +111,11 @@ class TranslationHybrid(object):
         is no translation found for default locale it returns None.
         """
         def getter(obj):
+            key = self.projection_key(attr)
+            if attr.key not in obj.__dict__ and key in obj.__dict__:
+                value = obj.__dict__[key]
+                return self.default_value if value is None else value
+
             current_locale = cast_locale(obj, self.current_locale)
             try:
                 return getattr(obj, attr.key)[current_locale]
@@ -96,11 +139,96 @@ class TranslationHybrid(object):
 
     def expr_factory(self, attr):
         def expr(cls):
-            current_locale = cast_locale_expr(cls, self.current_locale)
-            default_locale = cast_locale_expr(cls, self.default_locale)
-            return sa.func.coalesce(attr[current_locale], attr[default_locale])
+            return self.translation_expr(cls, attr)
         return expr
 
+    def projection_key(self, attr):
+        """
+        Return the key of the deferred column property that holds the
+        projected translation of given translations column.
+        """
+        return '_{0}_translation'.format(attr.key)
+
+    def load_option(self, attr):
+        """
+        Return a query option that loads only the translation for the current
+        locale (falling back to the default locale) of given translations
+        attribute and defers loading the full translations dictionary.
+
+        ::
+
+            query = session.query(City).options(
+                translation_hybrid.load_option(City.name_translations)
+            )
+            for city in query:
+                city.name  # no need to load all translations
+
+        The locale is resolved when the query is compiled, hence the loaded
+        value is not refreshed if the current locale changes afterwards.
+        Accessing the translations dictionary itself loads it normally.
+
+        :param attr: InstrumentedAttribute of the translations column
+        """
+        column = attr.property.columns[0]
+        mapper = sa.inspect(attr.class_)
+        key = self.projection_key(column)
+        if not mapper.has_property(key):
+            mapper.add_property(
+                key,
+                sa.orm.column_property(
+                    self.translation_expr(attr.class_, column),
+                    deferred=True
+                )
+            )
+        return sa.orm.Load(attr.class_).defer(attr.key).undefer(key)
+
+    def indexes(self, attr, locales, **kwargs):
+        """
+        Return functional indexes for given translations attribute, one for
+        each of given locales. Each index matches the hybrid expression when
+        the current locale is the given locale, hence filtering and ordering
+        by the hybrid can use the indexes.
+
+        ::
+
+            for index in translation_hybrid.indexes(
+                City.name_translations,
+                ['fi', 'en', 'sv']
+            ):
+                index.create(bind=engine)
+
+        :param attr: InstrumentedAttribute of the translations column
+        :param locales: locales to create indexes for
+        :param kwargs: additional keyword arguments passed to Index
+        """
+        column = attr.property.columns[0]
+        name = 'ix_{0}_{1}_{{0}}'.format(column.table.name, column.name)
+        return [
+            sa.Index(
+                name.format(locale),
+                self.translation_expr(attr.class_, column, locale),
+                **kwargs
+            )
+            for locale in locales
+        ]
+
+    def translation_expr(self, cls, attr, current_locale=None):
+        """
+        Return the SQL expression for the translation of given translations
+        column.
+
+        :param cls: class used as a parameter to locale callables
+        :param attr: translations column
+        :param current_locale:
+            locale to use instead of the current locale of this hybrid
+        """
+        if current_locale is None:
+            current_locale = self.current_locale
+        return sa.func.coalesce(
+            text_item(attr, cast_locale_expr(cls, current_locale)),
+            text_item(attr, cast_locale_expr(cls, self.default_locale))
+        )
+
     def __call__(self, attr):
         return hybrid_property(
             fget=self.getter_factory(attr),
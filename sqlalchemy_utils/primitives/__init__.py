@@ -1,4 +1,5 @@
 from .country import Country  # noqa
 from .currency import Currency  # noqa
+from .locale_cache import clear_locale_cache, prewarm_locale_cache  # noqa
 from .weekday import WeekDay  # noqa
 from .weekdays import WeekDays  # noqa
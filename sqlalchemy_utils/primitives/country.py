@@ -3,6 +3,8 @@ import six
 from sqlalchemy_utils import i18n
 from sqlalchemy_utils.utils import str_coercible
 
+from .locale_cache import get_country_name
+
 
 @str_coercible
 class Country(object):
@@ -49,13 +51,25 @@ class Country(object):
 
         assert hash(Country('FI')) == hash('FI')
 
+
+    Country objects are interned, there is only one Country object per
+    country code.
+
+    ::
+
+        assert Country('FI') is Country('FI')
+
     """
-    def __init__(self, code_or_country):
+    __slots__ = ('_code',)
+
+    _instances = {}
+    _codes = None
+
+    def __new__(cls, code_or_country):
         if isinstance(code_or_country, Country):
-            self.code = code_or_country.code
+            code = code_or_country.code
         elif isinstance(code_or_country, six.string_types):
-            self.validate(code_or_country)
-            self.code = code_or_country
+            code = code_or_country
         else:
             raise TypeError(
                 "Country() argument must be a string or a country, not '{0}'"
@@ -63,16 +77,31 @@ class Country(object):
                     type(code_or_country).__name__
                 )
             )
+        try:
+            return cls._instances[code]
+        except KeyError:
+            cls.validate(code)
+            country = object.__new__(cls)
+            country._code = code
+            return cls._instances.setdefault(code, country)
+
+    def __reduce__(self):
+        return (self.__class__, (self.code, ))
+
+    @property
+    def code(self):
+        # The code is read-only, as the interned instances are shared.
+        return self._code
 
     @property
     def name(self):
-        return i18n.get_locale().territories[self.code]
+        return get_country_name(self.code)
 
     @classmethod
-    def validate(self, code):
-        try:
-            i18n.babel.Locale('en').territories[code]
-        except KeyError:
+    def validate(cls, code):
+        if cls._codes is None:
+            cls._codes = frozenset(i18n.babel.Locale('en').territories)
+        if code not in cls._codes:
             raise ValueError(
                 'Could not convert string to country code: {0}'.format(code)
             )
@@ -4,6 +4,8 @@ import six
 from sqlalchemy_utils import i18n, ImproperlyConfigured
 from sqlalchemy_utils.utils import str_coercible
 
+from .locale_cache import get_currency_name, get_currency_symbol
+
 
 @str_coercible
 class Currency(object):
@@ -51,41 +53,62 @@ class Currency(object):
         len(set([Currency('USD'), Currency('USD')]))  # 1
 
 
+    Currency objects are interned, there is only one Currency object per
+    currency code.
+
+    ::
+
+        assert Currency('USD') is Currency('USD')
+
     """
-    def __init__(self, code):
+    __slots__ = ('_code',)
+
+    _instances = {}
+    _codes = None
+
+    def __new__(cls, code):
         if i18n.babel is None:
             raise ImproperlyConfigured(
                 "'babel' package is required in order to use Currency class."
             )
         if isinstance(code, Currency):
-            self.code = code
-        elif isinstance(code, six.string_types):
-            self.validate(code)
-            self.code = code
-        else:
+            return code
+        elif not isinstance(code, six.string_types):
             raise TypeError(
                 'First argument given to Currency constructor should be '
                 'either an instance of Currency or valid three letter '
                 'currency code.'
             )
-
-    @classmethod
-    def validate(self, code):
         try:
-            i18n.babel.Locale('en').currencies[code]
+            return cls._instances[code]
         except KeyError:
+            cls.validate(code)
+            currency = object.__new__(cls)
+            currency._code = code
+            return cls._instances.setdefault(code, currency)
+
+    def __reduce__(self):
+        return (self.__class__, (self.code, ))
+
+    @property
+    def code(self):
+        # The code is read-only, as the interned instances are shared.
+        return self._code
+
+    @classmethod
+    def validate(cls, code):
+        if cls._codes is None:
+            cls._codes = frozenset(i18n.babel.Locale('en').currencies)
+        if code not in cls._codes:
             raise ValueError("{0}' is not valid currency code.")
 
     @property
     def symbol(self):
-        return i18n.babel.numbers.get_currency_symbol(
-            self.code,
-            i18n.get_locale()
-        )
+        return get_currency_symbol(self.code)
 
     @property
     def name(self):
-        return i18n.get_locale().currencies[self.code]
+        return get_currency_name(self.code)
 
     def __eq__(self, other):
         if isinstance(other, Currency):
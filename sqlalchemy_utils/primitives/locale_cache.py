@@ -0,0 +1,92 @@
+import six
+
+from sqlalchemy_utils import i18n
+
+_country_names = {}
+_currency_names = {}
+_currency_symbols = {}
+
+
+def _get_locale_data(cache, locale, attr):
+    # The cache is keyed by locale identifiers, as older babel versions
+    # define Locale.__eq__ without __hash__.
+    if isinstance(locale, six.string_types):
+        key = locale
+    elif isinstance(locale, i18n.babel.Locale):
+        key = str(locale)
+    else:
+        # Other locale-like objects are not cached.
+        return getattr(locale, attr)
+    try:
+        return cache[key]
+    except KeyError:
+        if isinstance(locale, six.string_types):
+            locale = i18n.babel.Locale.parse(locale)
+        return cache.setdefault(key, dict(getattr(locale, attr)))
+
+
+def get_country_name(code, locale=None):
+    """
+    Return the name of given country code in given locale. The names of each
+    locale are cached on first use.
+
+    :param code: country code
+    :param locale: locale, defaults to the current locale
+    """
+    if locale is None:
+        locale = i18n.get_locale()
+    return _get_locale_data(_country_names, locale, 'territories')[code]
+
+
+def get_currency_name(code, locale=None):
+    """
+    Return the name of given currency code in given locale. The names of each
+    locale are cached on first use.
+
+    :param code: currency code
+    :param locale: locale, defaults to the current locale
+    """
+    if locale is None:
+        locale = i18n.get_locale()
+    return _get_locale_data(_currency_names, locale, 'currencies')[code]
+
+
+def get_currency_symbol(code, locale=None):
+    """
+    Return the symbol of given currency code in given locale. If the locale
+    has no symbol for the currency, the currency code is returned. The
+    symbols of each locale are cached on first use.
+
+    :param code: currency code
+    :param locale: locale, defaults to the current locale
+    """
+    if locale is None:
+        locale = i18n.get_locale()
+    symbols = _get_locale_data(_currency_symbols, locale, 'currency_symbols')
+    return symbols.get(code, code)
+
+
+def prewarm_locale_cache(locales):
+    """
+    Populate the country and currency name and symbol caches for given
+    locales, for example when the application starts.
+
+    ::
+
+        prewarm_locale_cache(['en', 'fi', 'sv'])
+
+    :param locales: locale objects or locale identifiers
+    """
+    for locale in locales:
+        _get_locale_data(_country_names, locale, 'territories')
+        _get_locale_data(_currency_names, locale, 'currencies')
+        _get_locale_data(_currency_symbols, locale, 'currency_symbols')
+
+
+def clear_locale_cache():
+    """
+    Clear the country and currency name and symbol caches.
+    """
+    _country_names.clear()
+    _currency_names.clear()
+    _currency_symbols.clear()
@@ -1,5 +1,6 @@
 import six
 
+from sqlalchemy_utils import i18n
 from sqlalchemy_utils.utils import str_coercible
 
 from .weekday import WeekDay
@@ -7,10 +8,27 @@ from .weekday import WeekDay
 
 @str_coercible
 class WeekDays(object):
+    """
+    WeekDays wraps a set of week days. The days are stored as a 7-bit integer
+    mask where the bit ``1 << index`` is set for each week day index
+    (0 = Monday), hence membership tests, unions and intersections are
+    bitwise operations.
+
+    WeekDays can be constructed from a bit string, a mask, another WeekDays
+    object or an iterable of WeekDay objects.
+
+    ::
+
+        days = WeekDays('1000100')  # Monday, Friday
+        days.mask  # 17
+
+        WeekDay(0) in days  # True
+
+        days | WeekDays('0100000')  # WeekDays('1100100')
+        days & WeekDays('0000111')  # WeekDays('0000100')
+    """
     def __init__(self, bit_string_or_week_days):
         if isinstance(bit_string_or_week_days, six.string_types):
-            self._days = set()
-
             if len(bit_string_or_week_days) != WeekDay.NUM_WEEK_DAYS:
                 raise ValueError(
                     'Bit string must be {0} characters long.'.format(
@@ -18,32 +36,65 @@ class WeekDays(object):
                     )
                 )
 
+            self.mask = 0
             for index, bit in enumerate(bit_string_or_week_days):
                 if bit not in '01':
                     raise ValueError(
                         'Bit string may only contain zeroes and ones.'
                     )
                 if bit == '1':
-                    self._days.add(WeekDay(index))
+                    self.mask |= 1 << index
         elif isinstance(bit_string_or_week_days, WeekDays):
-            self._days = bit_string_or_week_days._days
+            self.mask = bit_string_or_week_days.mask
+        elif isinstance(bit_string_or_week_days, six.integer_types):
+            if not (0 <= bit_string_or_week_days < 1 << WeekDay.NUM_WEEK_DAYS):
+                raise ValueError(
+                    'Mask must be between 0 and {0}.'.format(
+                        (1 << WeekDay.NUM_WEEK_DAYS) - 1
+                    )
+                )
+            self.mask = bit_string_or_week_days
         else:
-            self._days = set(bit_string_or_week_days)
+            self.mask = 0
+            for day in bit_string_or_week_days:
+                self.mask |= 1 << day.index
 
     def __eq__(self, other):
         if isinstance(other, WeekDays):
-            return self._days == other._days
+            return self.mask == other.mask
         elif isinstance(other, six.string_types):
             return self.as_bit_string() == other
         else:
             return NotImplemented
 
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
     def __iter__(self):
-        for day in sorted(self._days):
-            yield day
+        first_week_day = i18n.get_locale().first_week_day
+        for position in six.moves.xrange(WeekDay.NUM_WEEK_DAYS):
+            index = (first_week_day + position) % WeekDay.NUM_WEEK_DAYS
+            if self.mask & (1 << index):
+                yield WeekDay(index)
 
     def __contains__(self, value):
-        return value in self._days
+        return (
+            isinstance(value, WeekDay) and
+            bool(self.mask & (1 << value.index))
+        )
+
+    def __or__(self, other):
+        if not isinstance(other, WeekDays):
+            return NotImplemented
+        return WeekDays(self.mask | other.mask)
+
+    def __and__(self, other):
+        if not isinstance(other, WeekDays):
+            return NotImplemented
+        return WeekDays(self.mask & other.mask)
 
     def __repr__(self):
         return '%s(%r)' % (
@@ -56,6 +107,6 @@ class WeekDays(object):
 
     def as_bit_string(self):
         return ''.join(
-            '1' if WeekDay(index) in self._days else '0'
+            '1' if self.mask & (1 << index) else '0'
             for index in six.moves.xrange(WeekDay.NUM_WEEK_DAYS)
         )
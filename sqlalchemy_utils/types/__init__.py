@@ -8,9 +8,9 @@ from .color import ColorType  # noqa
 from .country import CountryType  # noqa
 from .currency import CurrencyType  # noqa
 from .email import EmailType  # noqa
-from .encrypted import EncryptedType  # noqa
+from .encrypted import EncryptedType, reencrypt  # noqa
 from .ip_address import IPAddressType  # noqa
-from .json import JSONType  # noqa
+from .json import json_gin_index, json_path_index, JSONType  # noqa
 from .locale import LocaleType  # noqa
 from .password import Password, PasswordType  # noqa
 from .pg_composite import (  # noqa
@@ -30,7 +30,7 @@ from .scalar_list import ScalarListException, ScalarListType  # noqa
 from .timezone import TimezoneType  # noqa
 from .ts_vector import TSVectorType  # noqa
 from .url import URLType  # noqa
-from .uuid import UUIDType  # noqa
+from .uuid import uuid7, UUIDType  # noqa
 from .weekdays import WeekDaysType  # noqa
 
 
@@ -85,6 +85,23 @@ class ChoiceType(types.TypeDecorator, ScalarCoercible):
         user.type  # <UserType.admin: 1>
 
 
+    Choices with integer codes can be stored in integer columns, for example
+    using ``impl=sa.SmallInteger()``. Each code is mapped to one shared
+    Choice object when the type is constructed.
+
+    ::
+
+        class User(Base):
+            TYPES = [
+                (0, u'Admin'),
+                (1, u'Regular user')
+            ]
+
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            type = sa.Column(ChoiceType(TYPES, impl=sa.SmallInteger()))
+
+
     ChoiceType is very useful when the rendered values change based on user's
     locale:
 
@@ -178,23 +195,31 @@ class ChoiceTypeImpl(object):
                 'ChoiceType needs list of choices defined.'
             )
         self.choices_dict = dict(choices)
+        # One shared Choice object per code.
+        self.choice_objects = dict(
+            (code, Choice(code, value))
+            for code, value in self.choices_dict.items()
+        )
 
     def _coerce(self, value):
         if value is None:
             return value
         if isinstance(value, Choice):
             return value
-        return Choice(value, self.choices_dict[value])
+        return self.choice_objects[value]
 
     def process_bind_param(self, value, dialect):
-        if value and isinstance(value, Choice):
+        if isinstance(value, Choice):
             return value.code
         return value
 
     def process_result_value(self, value, dialect):
-        if value:
-            return Choice(value, self.choices_dict[value])
-        return value
+        try:
+            return self.choice_objects[value]
+        except KeyError:
+            if value:
+                raise
+            return value
 
 
 class EnumTypeImpl(object):
@@ -212,16 +237,26 @@ class EnumTypeImpl(object):
             )
 
         self.enum_class = enum_class
+        self.members = {}
+        for member in enum_class:
+            try:
+                self.members[member.value] = member
+            except TypeError:
+                # Unhashable values are looked up using the enum class.
+                pass
 
     def _coerce(self, value):
-        if value is None:
-            return None
-        return self.enum_class(value)
+        if value is None or isinstance(value, self.enum_class):
+            return value
+        try:
+            return self.members[value]
+        except (KeyError, TypeError):
+            return self.enum_class(value)
 
     def process_bind_param(self, value, dialect):
         if value is None:
             return None
-        return self.enum_class(value).value
+        return self._coerce(value).value
 
     def process_result_value(self, value, dialect):
         return self._coerce(value)
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 import base64
 import datetime
+import hashlib
+import hmac
+import os
+import sys
 
 import six
-from sqlalchemy.types import Binary, String, TypeDecorator
+import sqlalchemy as sa
+from sqlalchemy.sql.expression import ClauseElement
+from sqlalchemy.types import Binary, LargeBinary, String, TypeDecorator
 
 from sqlalchemy_utils.exceptions import ImproperlyConfigured
 
@@ -17,9 +23,18 @@ try:
     from cryptography.hazmat.primitives.ciphers import(
         Cipher, algorithms, modes
     )
-    from cryptography.fernet import Fernet
+    from cryptography.exceptions import InvalidTag
+    from cryptography.fernet import Fernet, InvalidToken
 except ImportError:
     pass
+else:
+    # Errors raised when a value is decrypted with the wrong key.
+    DECRYPTION_ERRORS = (InvalidTag, InvalidToken, ValueError)
+
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+except ImportError:
+    AESGCM = None
 
 
 class EncryptionDecryptionBaseEngine(object):
@@ -27,16 +42,40 @@ class EncryptionDecryptionBaseEngine(object):
 
     This class must be sub-classed in order to create
     new engines.
+
+    The engine is initialized only when the given key differs from the key
+    the engine was last initialized with. Derived keys are cached per raw key
+    so that alternating between a few keys (for example when using callable
+    keys) does not re-hash them.
     """
 
-    def _update_key(self, key):
-        if isinstance(key, six.string_types):
-            key = key.encode()
+    #: Maximum number of derived keys cached per engine.
+    key_cache_size = 128
+
+    def __init__(self):
+        self._key = None
+        self._derived_keys = {}
+
+    def _derive_key(self, key):
+        try:
+            return self._derived_keys[key]
+        except KeyError:
+            pass
         digest = hashes.Hash(hashes.SHA256(), backend=default_backend())
         digest.update(key)
         engine_key = digest.finalize()
+        if len(self._derived_keys) >= self.key_cache_size:
+            self._derived_keys.clear()
+        self._derived_keys[key] = engine_key
+        return engine_key
 
-        self._initialize_engine(engine_key)
+    def _update_key(self, key):
+        if isinstance(key, six.string_types):
+            key = key.encode()
+        if self._key is not None and key == self._key:
+            return
+        self._initialize_engine(self._derive_key(key))
+        self._key = key
 
     def encrypt(self, value):
         raise NotImplementedError('Subclasses must implement this!')
@@ -44,6 +83,13 @@ class EncryptionDecryptionBaseEngine(object):
     def decrypt(self, value):
         raise NotImplementedError('Subclasses must implement this!')
 
+    def decrypt_many(self, values):
+        """
+        Decrypt given sequence of values. `None` values are returned as is.
+        """
+        decrypt = self.decrypt
+        return [None if value is None else decrypt(value) for value in values]
+
 
 class AesEngine(EncryptionDecryptionBaseEngine):
     """Provide AES encryption and decryption methods."""
@@ -91,6 +137,67 @@ class AesEngine(EncryptionDecryptionBaseEngine):
         return decrypted
 
 
+class AesGcmEngine(EncryptionDecryptionBaseEngine):
+    """Provide authenticated AES-GCM encryption and decryption methods.
+
+    Every value is encrypted with a random nonce, hence encrypting the same
+    value twice produces different ciphertexts. This also means that values
+    encrypted with this engine cannot be looked up by equality in SQL.
+
+    The values are stored as raw bytes in the form ``nonce + ciphertext +
+    tag`` without base64 encoding.
+    """
+
+    NONCE_SIZE = 12
+    TAG_SIZE = 16
+
+    def _initialize_engine(self, parent_class_key):
+        self.secret_key = parent_class_key
+        self.algorithm = algorithms.AES(self.secret_key)
+        self.backend = default_backend()
+        # AESGCM is considerably faster than the Cipher API but it is only
+        # available in newer versions of cryptography.
+        self.aesgcm = AESGCM(self.secret_key) if AESGCM else None
+
+    def encrypt(self, value):
+        if not isinstance(value, six.string_types):
+            value = repr(value)
+        if isinstance(value, six.text_type):
+            value = str(value)
+        value = value.encode()
+        nonce = os.urandom(self.NONCE_SIZE)
+        if self.aesgcm is not None:
+            return nonce + self.aesgcm.encrypt(nonce, value, None)
+        encryptor = Cipher(
+            self.algorithm,
+            modes.GCM(nonce),
+            backend=self.backend
+        ).encryptor()
+        encrypted = encryptor.update(value) + encryptor.finalize()
+        return nonce + encrypted + encryptor.tag
+
+    def decrypt(self, value):
+        value = bytes(value)
+        nonce = value[:self.NONCE_SIZE]
+        if self.aesgcm is not None:
+            decrypted = self.aesgcm.decrypt(
+                nonce, value[self.NONCE_SIZE:], None
+            )
+        else:
+            tag = value[-self.TAG_SIZE:]
+            decryptor = Cipher(
+                self.algorithm,
+                modes.GCM(nonce, tag),
+                backend=self.backend
+            ).decryptor()
+            decrypted = decryptor.update(
+                value[self.NONCE_SIZE:-self.TAG_SIZE]
+            ) + decryptor.finalize()
+        if not isinstance(decrypted, six.string_types):
+            decrypted = decrypted.decode('utf-8')
+        return decrypted
+
+
 class FernetEngine(EncryptionDecryptionBaseEngine):
     """Provide Fernet encryption and decryption methods."""
 
@@ -198,11 +305,147 @@ class EncryptedType(TypeDecorator, ScalarCoercible):
             username = sa.Column(EncryptedType(
                 sa.Unicode, get_key))
 
+    The encryption engine can be chosen with the engine parameter. The
+    default :class:`AesEngine` uses a fixed IV, which makes it possible to
+    look up values by equality but also reveals which rows share the same
+    value. :class:`AesGcmEngine` uses a random nonce for every value and
+    authenticates the stored ciphertexts. :class:`FernetEngine` also uses
+    random IVs.
+
+    ::
+
+        from sqlalchemy_utils.types.encrypted import AesGcmEngine
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode, secret_key, AesGcmEngine))
+
+    Values encrypted with random IVs can be looked up by equality using a
+    blind index. The blind index is a companion column holding an HMAC of
+    the plain value. It is updated automatically whenever the encrypted
+    value changes and equality comparisons (``==``, ``!=``, ``in_`` and
+    ``notin_``) against the encrypted column are rewritten to compare the
+    blind index column instead.
+
+    ::
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            email = sa.Column(EncryptedType(
+                sa.Unicode,
+                secret_key,
+                AesGcmEngine,
+                blind_index='email_index',
+                blind_index_key=blind_index_key
+            ))
+            email_index = sa.Column(sa.LargeBinary(32), index=True)
+
+
+        session.query(User).filter(User.email == u'john@example.com')
+
+    If no `blind_index_key` is given, the blind index key is derived from the
+    encryption key. The blind index key should not vary per row, otherwise
+    equal values would not have equal blind indexes.
+
+    Keys can be rotated by giving them ids. When `key_id` is given, stored
+    values are prefixed with the key id. Values encrypted with earlier keys
+    can still be decrypted when their keys are given in `previous_keys`, a
+    dict mapping key ids to keys. The key id `None` stands for values
+    stored without a key id prefix. Raw AesGcmEngine ciphertexts stored
+    without a key id may start with a key id prefix by chance, hence values
+    that fail to decrypt with the key of their prefix are decrypted as
+    values without a key id.
+
+    ::
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode,
+                new_key,
+                key_id='2',
+                previous_keys={None: old_key}
+            ))
+
+    Existing values can then be re-encrypted with the new key using
+    :func:`reencrypt`.
+
+    With `lazy=True` loaded values are not decrypted right away. Instead
+    the column returns :class:`EncryptedValue` proxies that decrypt the
+    value on first access. This way queries loading whole rows do not pay
+    for decrypting values that are never used.
+
+    ::
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode, secret_key, lazy=True))
+
+
+        user = session.query(User).first()
+        user.username  # EncryptedValue, not decrypted yet
+        user.username == u'someone'  # decrypts the value
     """
 
     impl = Binary
 
-    def __init__(self, type_in=None, key=None, engine=None, **kwargs):
+    class comparator_factory(TypeDecorator.Comparator):
+        def _blind_index_column(self, other):
+            name = self.type.blind_index
+            if name is None or other is None or (
+                isinstance(other, ClauseElement)
+            ):
+                return None
+            return self.expr.table.c[name]
+
+        def _blind_index_values(self, other):
+            return [
+                sa.literal(value, type_=BlindIndexValue(self.type))
+                for value in other
+            ]
+
+        def __eq__(self, other):
+            column = self._blind_index_column(other)
+            if column is None:
+                return TypeDecorator.Comparator.__eq__(self, other)
+            return column == self._blind_index_values([other])[0]
+
+        def __ne__(self, other):
+            column = self._blind_index_column(other)
+            if column is None:
+                return TypeDecorator.Comparator.__ne__(self, other)
+            return column != self._blind_index_values([other])[0]
+
+        def in_(self, other):
+            column = self._blind_index_column(other)
+            if column is None:
+                return TypeDecorator.Comparator.in_(self, other)
+            return column.in_(self._blind_index_values(other))
+
+        def notin_(self, other):
+            column = self._blind_index_column(other)
+            if column is None:
+                return TypeDecorator.Comparator.notin_(self, other)
+            return column.notin_(self._blind_index_values(other))
+
+    def __init__(
+        self,
+        type_in=None,
+        key=None,
+        engine=None,
+        blind_index=None,
+        blind_index_key=None,
+        key_id=None,
+        previous_keys=None,
+        lazy=False,
+        **kwargs
+    ):
         """Initialization."""
         if not cryptography:
             raise ImproperlyConfigured(
@@ -219,6 +462,12 @@ class EncryptedType(TypeDecorator, ScalarCoercible):
         if not engine:
             engine = AesEngine
         self.engine = engine()
+        self.blind_index = blind_index
+        self.blind_index_key = blind_index_key
+        self.key_id = key_id
+        self.previous_keys = previous_keys or {}
+        self._previous_engines = {}
+        self.lazy = lazy
 
     @property
     def key(self):
@@ -232,68 +481,565 @@ class EncryptedType(TypeDecorator, ScalarCoercible):
         key = self._key() if callable(self._key) else self._key
         self.engine._update_key(key)
 
+    @property
+    def _uses_key_ids(self):
+        return self.key_id is not None or bool(self.previous_keys)
+
+    def _key_id_prefix(self, key_id):
+        if isinstance(key_id, six.text_type):
+            key_id = key_id.encode('utf-8')
+        return key_id + b':'
+
+    def _split_key_id(self, value):
+        """
+        Split given stored value into a key id and the ciphertext. Values
+        without a known key id prefix get the key id `None`.
+        """
+        if isinstance(value, six.text_type):
+            value = value.encode('utf-8')
+        key_ids = [self.key_id] + list(self.previous_keys)
+        for key_id in key_ids:
+            if key_id is None:
+                continue
+            prefix = self._key_id_prefix(key_id)
+            if value.startswith(prefix):
+                return key_id, value[len(prefix):]
+        return None, value
+
+    def _previous_engine(self, key_id):
+        key = self.previous_keys[key_id]
+        key = key() if callable(key) else key
+        try:
+            engine = self._previous_engines[key_id]
+        except KeyError:
+            engine = self._previous_engines[key_id] = self.engine.__class__()
+        engine._update_key(key)
+        return engine
+
+    def _encrypt(self, value):
+        encrypted = self.engine.encrypt(value)
+        if self.key_id is not None:
+            return self._key_id_prefix(self.key_id) + encrypted
+        return encrypted
+
+    def _key_id_engine(self, key_id):
+        if key_id == self.key_id or key_id not in self.previous_keys:
+            return self.engine
+        return self._previous_engine(key_id)
+
+    def _decrypt(self, value, engine=None):
+        """
+        Decrypt given stored value with the key it was encrypted with.
+
+        :param value: stored value
+        :param engine: engine to use instead of the engine of the key id
+        """
+        if not self._uses_key_ids:
+            return (engine or self.engine).decrypt(value)
+        key_id, ciphertext = self._split_key_id(value)
+        if key_id is None:
+            return (engine or self._key_id_engine(None)).decrypt(value)
+        try:
+            return (engine or self._key_id_engine(key_id)).decrypt(ciphertext)
+        except DECRYPTION_ERRORS:
+            # The raw ciphertexts of binary engines such as AesGcmEngine may
+            # start with a key id prefix by chance. Such values were stored
+            # without a key id.
+            exc_info = sys.exc_info()
+            try:
+                return (engine or self._key_id_engine(None)).decrypt(value)
+            except DECRYPTION_ERRORS:
+                six.reraise(*exc_info)
+
+    def _decrypt_many(self, values):
+        if not self._uses_key_ids:
+            return self.engine.decrypt_many(values)
+        return [
+            None if value is None else self._decrypt(value)
+            for value in values
+        ]
+
+    def _process_underlying_bind_param(self, value, dialect):
+        try:
+            value = self.underlying_type.process_bind_param(
+                value, dialect
+            )
+
+        except AttributeError:
+            # Doesn't have 'process_bind_param'
+
+            # Handle 'boolean' and 'dates'
+            type_ = self.underlying_type.python_type
+            if issubclass(type_, bool):
+                value = 'true' if value else 'false'
+
+            elif issubclass(type_, (datetime.date, datetime.time)):
+                value = value.isoformat()
+        return value
+
     def process_bind_param(self, value, dialect):
         """Encrypt a value on the way in."""
+        if isinstance(value, EncryptedValue):
+            value = value.value
         if value is not None:
             self._update_key()
+            value = self._process_underlying_bind_param(value, dialect)
+            return self._encrypt(value)
+
+    def _get_blind_index_key(self, key=None):
+        if self.blind_index_key is not None:
+            key = self.blind_index_key
+            key = key() if callable(key) else key
+            if isinstance(key, six.text_type):
+                key = key.encode('utf-8')
+            return key
+        if key is None:
+            key = self._key() if callable(self._key) else self._key
+        if isinstance(key, six.text_type):
+            key = key.encode('utf-8')
+        return hmac.new(key, b'blind_index', hashlib.sha256).digest()
+
+    def _blind_index_digest(self, value, key=None):
+        if isinstance(value, six.text_type):
+            value = value.encode('utf-8')
+        return hmac.new(
+            self._get_blind_index_key(key),
+            value,
+            hashlib.sha256
+        ).digest()
+
+    def blind_index_value(self, value, dialect):
+        """
+        Return the blind index (HMAC-SHA256 digest) of given plain value.
+
+        :param value: plain value
+        :param dialect: dialect used for processing the underlying type
+        """
+        if isinstance(value, EncryptedValue):
+            value = value.value
+        if value is None:
+            return None
+        value = self._process_underlying_bind_param(value, dialect)
+        if not isinstance(value, six.string_types):
+            value = repr(value)
+        return self._blind_index_digest(value)
+
+    def _result_converter(self, dialect):
+        """
+        Return a function that converts decrypted strings to values of the
+        underlying type. The type dispatch is done once here instead of for
+        every value.
+        """
+        if hasattr(self.underlying_type, 'process_result_value'):
+            process_result_value = self.underlying_type.process_result_value
+
+            def convert(value):
+                return process_result_value(value, dialect)
+            return convert
+
+        # Handle 'boolean' and 'dates'
+        type_ = self.underlying_type.python_type
+        if issubclass(type_, bool):
+            return lambda value: value == 'true'
+
+        elif issubclass(type_, datetime.datetime):
+            return lambda value: datetime.datetime.strptime(
+                value, '%Y-%m-%dT%H:%M:%S'
+            )
 
-            try:
-                value = self.underlying_type.process_bind_param(
-                    value, dialect
-                )
-
-            except AttributeError:
-                # Doesn't have 'process_bind_param'
+        elif issubclass(type_, datetime.time):
+            return lambda value: datetime.datetime.strptime(
+                value, '%H:%M:%S'
+            ).time()
 
-                # Handle 'boolean' and 'dates'
-                type_ = self.underlying_type.python_type
-                if issubclass(type_, bool):
-                    value = 'true' if value else 'false'
+        elif issubclass(type_, datetime.date):
+            return lambda value: datetime.datetime.strptime(
+                value, '%Y-%m-%d'
+            ).date()
 
-                elif issubclass(type_, (datetime.date, datetime.time)):
-                    value = value.isoformat()
+        # Handle all others
+        return type_
 
-            return self.engine.encrypt(value)
+    def _decrypt_lazy(self, value, dialect, key):
+        self.engine._update_key(key)
+        return self._result_converter(dialect)(self._decrypt(value))
 
     def process_result_value(self, value, dialect):
         """Decrypt value on the way out."""
         if value is not None:
+            if self.lazy:
+                key = self._key() if callable(self._key) else self._key
+                return EncryptedValue(self, value, dialect, key)
             self._update_key()
-            decrypted_value = self.engine.decrypt(value)
+            decrypted_value = self._decrypt(value)
+            return self._result_converter(dialect)(decrypted_value)
+
+    def result_processor(self, dialect, coltype):
+        impl_processor = self.impl.result_processor(dialect, coltype)
+        if self.lazy:
+            def process(value):
+                if impl_processor:
+                    value = impl_processor(value)
+                return self.process_result_value(value, dialect)
+            return process
+
+        convert = self._result_converter(dialect)
+        update_key = self._update_key
+        decrypt = self._decrypt
+
+        def process(value):
+            if impl_processor:
+                value = impl_processor(value)
+            if value is not None:
+                update_key()
+                return convert(decrypt(value))
+        return process
+
+    def process_result_values(
+        self,
+        values,
+        dialect,
+        executor=None,
+        chunk_size=1000
+    ):
+        """
+        Decrypt a sequence of stored values at once. The key is resolved only
+        once, hence all values must have been encrypted with the same key.
+
+        Decryption of large batches can be offloaded to an executor, for
+        example a :class:`concurrent.futures.ThreadPoolExecutor`. The values
+        are then decrypted in chunks of `chunk_size` values in parallel.
+
+        ::
+
+            values = [
+                row[0] for row in
+                session.query(sa.type_coerce(User.username, sa.LargeBinary))
+            ]
+            type_ = User.__table__.c.username.type
+            usernames = type_.process_result_values(
+                values,
+                session.bind.dialect,
+                executor=ThreadPoolExecutor(4)
+            )
 
-            try:
-                return self.underlying_type.process_result_value(
-                    decrypted_value, dialect
+        :param values: sequence of encrypted values
+        :param dialect: dialect the values were fetched with
+        :param executor: optional executor used for decrypting the chunks
+        :param chunk_size: number of values decrypted per executor task
+        """
+        self._update_key()
+        convert = self._result_converter(dialect)
+        decrypt_many = self._decrypt_many
+
+        def process(chunk):
+            return [
+                None if value is None else convert(value)
+                for value in decrypt_many(chunk)
+            ]
+
+        return _map_chunks(process, list(values), executor, chunk_size)
+
+    def _coerce(self, value):
+        if isinstance(self.underlying_type, ScalarCoercible):
+            return self.underlying_type._coerce(value)
+
+        return value
+
+
+class EncryptedValue(object):
+    """
+    Proxy for an encrypted value loaded by a lazy :class:`EncryptedType`.
+    The value is decrypted on first access and cached. The key is resolved
+    when the value is loaded.
+
+    The proxy delegates comparisons, string conversion, hashing and
+    attribute access to the decrypted value. The decrypted value itself is
+    available as :attr:`value`.
+    """
+
+    __slots__ = ('_type', '_ciphertext', '_dialect', '_key', '_value')
+
+    _undecrypted = object()
+
+    def __init__(self, type_, ciphertext, dialect, key):
+        self._type = type_
+        self._ciphertext = ciphertext
+        self._dialect = dialect
+        self._key = key
+        self._value = self._undecrypted
+
+    @property
+    def is_decrypted(self):
+        return self._value is not self._undecrypted
+
+    @property
+    def value(self):
+        if self._value is self._undecrypted:
+            self._value = self._type._decrypt_lazy(
+                self._ciphertext,
+                self._dialect,
+                self._key
+            )
+            self._ciphertext = None
+        return self._value
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __eq__(self, other):
+        if isinstance(other, EncryptedValue):
+            other = other.value
+        return self.value == other
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __lt__(self, other):
+        if isinstance(other, EncryptedValue):
+            other = other.value
+        return self.value < other
+
+    def __le__(self, other):
+        return self < other or self == other
+
+    def __gt__(self, other):
+        return not (self <= other)
+
+    def __ge__(self, other):
+        return not (self < other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __bool__(self):
+        return bool(self.value)
+
+    __nonzero__ = __bool__
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __contains__(self, item):
+        return item in self.value
+
+    def __getitem__(self, key):
+        return self.value[key]
+
+    def __str__(self):
+        return str(self.value)
+
+    def __unicode__(self):
+        return six.text_type(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+def _map_chunks(func, values, executor, chunk_size):
+    if executor is None or len(values) <= chunk_size:
+        return func(values)
+    chunks = [
+        values[i:i + chunk_size]
+        for i in range(0, len(values), chunk_size)
+    ]
+    return [
+        value
+        for chunk in executor.map(func, chunks)
+        for value in chunk
+    ]
+
+
+def reencrypt(
+    session,
+    attr,
+    old_key=None,
+    new_key=None,
+    batch_size=1000,
+    executor=None
+):
+    """
+    Re-encrypt all values of given EncryptedType attribute. The rows are
+    streamed in primary key order in batches of `batch_size` rows and each
+    batch is written with a single executemany UPDATE, bypassing the ORM.
+
+    By default the values are decrypted with the key they were encrypted with
+    (see `key_id` and `previous_keys` of :class:`EncryptedType`) and
+    encrypted with the current key of the type. Typically you would first
+    configure the type with the new key and the old key as a previous key::
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode,
+                new_key,
+                key_id='2',
+                previous_keys={'1': old_key}
+            ))
+
+
+        reencrypt(session, User.username)
+        session.commit()
+
+    Alternatively the keys can be given explicitly with `old_key` and
+    `new_key`. Blind indexes of the column are recomputed as well.
+
+    The updates are executed within the current transaction of the session.
+    Objects already loaded in the session are not refreshed.
+
+    :param session: SQLAlchemy session
+    :param attr: InstrumentedAttribute of an EncryptedType column
+    :param old_key: key to decrypt the values with
+    :param new_key: key to encrypt the values with
+    :param batch_size: number of rows fetched and updated at once
+    :param executor:
+        optional executor, for example
+        :class:`concurrent.futures.ThreadPoolExecutor`, used for
+        re-encrypting the rows of each batch in parallel
+    :return: number of re-encrypted values
+    """
+    column = attr.property.columns[0]
+    type_ = column.type
+    table = column.table
+    primary_keys = list(table.primary_key.columns)
+    if len(primary_keys) != 1:
+        raise ImproperlyConfigured(
+            'reencrypt only supports tables with single column primary key.'
+        )
+    primary_key = primary_keys[0]
+
+    if old_key is None:
+        type_._update_key()
+        decrypt = type_._decrypt
+    else:
+        old_engine = type_.engine.__class__()
+        old_engine._update_key(old_key)
+
+        def decrypt(value):
+            return type_._decrypt(value, old_engine)
+
+    if new_key is None:
+        type_._update_key()
+        encrypt = type_._encrypt
+    else:
+        new_engine = type_.engine.__class__()
+        new_engine._update_key(new_key)
+
+        def encrypt(value):
+            encrypted = new_engine.encrypt(value)
+            if type_.key_id is not None:
+                return type_._key_id_prefix(type_.key_id) + encrypted
+            return encrypted
+
+    values = {column: sa.bindparam('_value', type_=LargeBinary)}
+    if type_.blind_index is not None:
+        values[table.c[type_.blind_index]] = sa.bindparam(
+            '_blind_index',
+            type_=LargeBinary
+        )
+    update = (
+        table.update()
+        .where(primary_key == sa.bindparam('_primary_key'))
+        .values(values)
+    )
+
+    def process(rows):
+        params = []
+        for id_, value in rows:
+            decrypted = decrypt(value)
+            row_params = {'_primary_key': id_, '_value': encrypt(decrypted)}
+            if type_.blind_index is not None:
+                row_params['_blind_index'] = type_._blind_index_digest(
+                    decrypted,
+                    new_key
                 )
+            params.append(row_params)
+        return params
+
+    connection = session.connection()
+    query = (
+        sa.select([primary_key, sa.type_coerce(column, LargeBinary)])
+        .where(column.isnot(None))
+        .order_by(primary_key)
+        .limit(batch_size)
+    )
+    count = 0
+    last_primary_key = None
+    while True:
+        batch_query = query
+        if last_primary_key is not None:
+            batch_query = query.where(primary_key > last_primary_key)
+        rows = [tuple(row) for row in connection.execute(batch_query)]
+        if not rows:
+            break
+        last_primary_key = rows[-1][0]
+        params = _map_chunks(process, rows, executor, batch_size // 4 or 1)
+        connection.execute(update, params)
+        count += len(params)
+    return count
+
+
+class BlindIndexValue(TypeDecorator):
+    """
+    Type for the blind index values compared against blind index columns.
+    Converts plain values to blind indexes on the way in.
+    """
 
-            except AttributeError:
-                # Doesn't have 'process_result_value'
+    impl = LargeBinary
 
-                # Handle 'boolean' and 'dates'
-                type_ = self.underlying_type.python_type
-                if issubclass(type_, bool):
-                    return decrypted_value == 'true'
+    def __init__(self, encrypted_type):
+        super(BlindIndexValue, self).__init__()
+        self.encrypted_type = encrypted_type
 
-                elif issubclass(type_, datetime.datetime):
-                    return datetime.datetime.strptime(
-                        decrypted_value, '%Y-%m-%dT%H:%M:%S'
-                    )
+    def process_bind_param(self, value, dialect):
+        return self.encrypted_type.blind_index_value(value, dialect)
 
-                elif issubclass(type_, datetime.time):
-                    return datetime.datetime.strptime(
-                        decrypted_value, '%H:%M:%S'
-                    ).time()
 
-                elif issubclass(type_, datetime.date):
-                    return datetime.datetime.strptime(
-                        decrypted_value, '%Y-%m-%d'
-                    ).date()
+def blind_index_listener(mapper, class_):
+    """
+    Assigns listeners that keep the blind index columns of all
+    EncryptedType properties of given mapper in sync with the encrypted
+    values.
+    """
+    blind_indexes = []
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        type_ = column.type
+        if not isinstance(type_, EncryptedType) or type_.blind_index is None:
+            continue
+        index_prop = mapper.get_property_by_column(
+            column.table.c[type_.blind_index]
+        )
+        blind_indexes.append((prop.key, index_prop.key, type_))
+
+    if not blind_indexes:
+        return
+
+    def update_blind_indexes(mapper, connection, target):
+        state = sa.inspect(target)
+        for key, index_key, type_ in blind_indexes:
+            if (
+                state.has_identity and
+                not state.attrs[key].history.has_changes()
+            ):
+                continue
+            setattr(
+                target,
+                index_key,
+                type_.blind_index_value(
+                    getattr(target, key),
+                    connection.dialect
+                )
+            )
 
-                # Handle all others
-                return self.underlying_type.python_type(decrypted_value)
+    sa.event.listen(mapper, 'before_insert', update_blind_indexes)
+    sa.event.listen(mapper, 'before_update', update_blind_indexes)
 
-    def _coerce(self, value):
-        if isinstance(self.underlying_type, ScalarCoercible):
-            return self.underlying_type._coerce(value)
 
-        return value
+sa.event.listen(sa.orm.mapper, 'mapper_configured', blind_index_listener)
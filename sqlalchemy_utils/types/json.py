@@ -2,6 +2,7 @@ from __future__ import absolute_import
 
 import six
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql.base import ischema_names
 
 from ..exceptions import ImproperlyConfigured
@@ -13,7 +14,7 @@ except ImportError:
     import json as json
 
 try:
-    from sqlalchemy.dialects.postgresql import JSON
+    from sqlalchemy.dialects.postgresql import JSON, JSONB
     has_postgres_json = True
 except ImportError:
     class PostgresJSONType(sa.types.UserDefinedType):
@@ -27,6 +28,24 @@ except ImportError:
     has_postgres_json = False
 
 
+def path_literal(keys, type_):
+    """
+    Return given JSON path as a text array literal, for example
+    ``'{"details","color"}'``. Paths are rendered as literals rather than bound
+    parameters so that query expressions match expression index definitions.
+    """
+    elements = u','.join(
+        u'"{0}"'.format(
+            six.text_type(key).replace(u'\\', u'\\\\').replace(u'"', u'\\"')
+        )
+        for key in keys
+    )
+    return sa.literal_column(
+        u"'{{{0}}}'".format(elements.replace(u"'", u"''")),
+        type_
+    )
+
+
 class JSONType(sa.types.TypeDecorator):
     """
     JSONType offers way of saving JSON data structures to database. On
@@ -53,20 +72,147 @@ class JSONType(sa.types.TypeDecorator):
             'max-speed': '400 mph'
         }
         session.commit()
+
+
+    On other databases than PostgreSQL the values are serialized using
+    anyjson, or the json module of the standard library if anyjson is not
+    installed. Faster JSON codecs can be used by giving the `serializer` and
+    `deserializer` arguments. Serializers may return either text or bytes.
+    If a binary type is given as the `impl` argument the serialized bytes are
+    stored as they are.
+
+    ::
+
+
+        import orjson
+
+
+        class Product(Base):
+            __tablename__ = 'product'
+            id = sa.Column(sa.Integer, autoincrement=True)
+            details = sa.Column(JSONType(
+                serializer=orjson.dumps,
+                deserializer=orjson.loads,
+                impl=sa.LargeBinary()
+            ))
+
+    On PostgreSQL the values are serialized by the database driver, which
+    can be configured with the `json_serializer` and `json_deserializer`
+    arguments of `create_engine`.
+
+    Pass `jsonb=True` to use the binary 'jsonb' type on PostgreSQL. JSONB
+    values are not reparsed on every access and JSONB columns support
+    containment and key existence comparators, which can use GIN indexes.
+    Path extraction comparators render the path as a literal, hence they
+    match expression indexes created with :func:`json_path_index`.
+
+    ::
+
+
+        class Product(Base):
+            __tablename__ = 'product'
+            id = sa.Column(sa.Integer, autoincrement=True)
+            details = sa.Column(JSONType(jsonb=True))
+
+
+        json_gin_index(Product.__table__.c.details)
+        json_path_index(Product.__table__.c.details, ['color'])
+
+
+        session.query(Product).filter(
+            Product.details.contains({'color': 'red'})
+        )
+        session.query(Product).filter(Product.details.has_key('max-speed'))
+        session.query(Product).filter(
+            Product.details.path_text('color') == 'red'
+        )
     """
     impl = sa.UnicodeText
 
+    class comparator_factory(sa.types.TypeDecorator.Comparator):
+        def contains(self, other, **kwargs):
+            """
+            Return an expression that is true when the document contains
+            given document. Requires JSONB storage.
+            """
+            if not self.type.jsonb:
+                return super(
+                    JSONType.comparator_factory,
+                    self
+                ).contains(other, **kwargs)
+            return self.expr.op('@>', is_comparison=True)(other)
+
+        def contained_by(self, other):
+            """
+            Return an expression that is true when the document is contained
+            by given document. Requires JSONB storage.
+            """
+            return self.expr.op('<@', is_comparison=True)(other)
+
+        def has_key(self, key):
+            """
+            Return an expression that is true when given key exists at the
+            top level of the document. Requires JSONB storage.
+            """
+            return self.expr.op('?', is_comparison=True)(
+                sa.literal(key, sa.UnicodeText)
+            )
+
+        def has_any(self, keys):
+            """
+            Return an expression that is true when any of given keys exists
+            at the top level of the document. Requires JSONB storage.
+            """
+            return self.expr.op('?|', is_comparison=True)(
+                sa.literal(list(keys), postgresql.ARRAY(sa.UnicodeText))
+            )
+
+        def has_all(self, keys):
+            """
+            Return an expression that is true when all of given keys exist
+            at the top level of the document. Requires JSONB storage.
+            """
+            return self.expr.op('?&', is_comparison=True)(
+                sa.literal(list(keys), postgresql.ARRAY(sa.UnicodeText))
+            )
+
+        def path(self, *keys):
+            """
+            Return an expression that extracts the JSON value at given path
+            using the ``#>`` operator.
+            """
+            return self.expr.op('#>')(path_literal(keys, self.type))
+
+        def path_text(self, *keys):
+            """
+            Return an expression that extracts the value at given path as text
+            using the ``#>>`` operator.
+            """
+            return self.expr.op('#>>')(path_literal(keys, sa.UnicodeText))
+
     def __init__(self, *args, **kwargs):
         if json is None:
             raise ImproperlyConfigured(
                 'JSONType needs anyjson package installed.'
             )
+        self.jsonb = kwargs.pop('jsonb', False)
+        self.serializer = kwargs.pop('serializer', None) or json.dumps
+        self.deserializer = kwargs.pop('deserializer', None) or json.loads
+        impl = kwargs.pop('impl', None)
         super(JSONType, self).__init__(*args, **kwargs)
+        if impl is not None:
+            self.impl = sa.types.to_instance(impl)
+
+    @property
+    def is_binary(self):
+        return isinstance(self.impl, sa.types._Binary)
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
             # Use the native JSON type.
             if has_postgres_json:
+                if self.jsonb:
+                    return dialect.type_descriptor(JSONB())
                 return dialect.type_descriptor(JSON())
             else:
                 return dialect.type_descriptor(PostgresJSONType())
@@ -77,12 +223,75 @@ class JSONType(sa.types.TypeDecorator):
         if dialect.name == 'postgresql' and has_postgres_json:
             return value
         if value is not None:
-            value = six.text_type(json.dumps(value))
+            value = self.serializer(value)
+            if self.is_binary:
+                if isinstance(value, six.text_type):
+                    value = value.encode('utf8')
+            elif isinstance(value, six.binary_type):
+                value = value.decode('utf8')
         return value
 
     def process_result_value(self, value, dialect):
         if dialect.name == 'postgresql':
             return value
         if value is not None:
-            value = json.loads(value)
+            value = self.deserializer(value)
         return value
+
+
+def json_gin_index(column, name=None, path_ops=False, **kwargs):
+    """
+    Return a GIN index for given JSONB column. The column must be attached
+    to a table, which the index is then added to. The index is used by the
+    `contains`, `contained_by`, `has_key`, `has_any` and `has_all`
+    comparators of :class:`JSONType`.
+
+    ::
+
+
+        json_gin_index(Product.__table__.c.details)
+
+    :param column: JSONType column with JSONB storage
+    :param name: index name, by default 'ix_<table>_<column>'
+    :param path_ops:
+        Whether to use the jsonb_path_ops operator class. These indexes are
+        smaller and faster but only support the `contains` comparator.
+    :param kwargs: additional keyword arguments passed to Index
+    """
+    if name is None:
+        name = 'ix_{0}_{1}'.format(column.table.name, column.name)
+    if path_ops:
+        kwargs['postgresql_ops'] = {column.name: 'jsonb_path_ops'}
+    return sa.Index(name, column, postgresql_using='gin', **kwargs)
+
+
+def json_path_index(column, keys, name=None, astext=True, **kwargs):
+    """
+    Return an expression index for the value at given path of given JSON
+    column. The column must be attached to a table, which the index is then
+    added to. The index matches the `path_text` comparator of
+    :class:`JSONType`, or the `path` comparator if `astext` is False.
+
+    ::
+
+
+        json_path_index(Product.__table__.c.details, ['color'])
+
+    :param column: JSONType column
+    :param keys: path to the indexed value
+    :param name: index name, by default 'ix_<table>_<column>_<keys>'
+    :param astext: whether to index the value as text
+    :param kwargs: additional keyword arguments passed to Index
+    """
+    keys = list(keys)
+    if name is None:
+        name = 'ix_{0}_{1}_{2}'.format(
+            column.table.name,
+            column.name,
+            '_'.join(six.text_type(key) for key in keys)
+        )
+    if astext:
+        expr = column.comparator.path_text(*keys)
+    else:
+        expr = column.comparator.path(*keys)
+    return sa.Index(name, expr, **kwargs)
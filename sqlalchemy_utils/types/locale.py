@@ -1,6 +1,7 @@
 import six
 from sqlalchemy import types
 
+from .. import i18n
 from ..exceptions import ImproperlyConfigured
 from .scalar_coercible import ScalarCoercible
 
@@ -46,7 +47,11 @@ class LocaleType(types.TypeDecorator, ScalarCoercible):
 
 
         user.locale = 'de_DE'
-        user.locale  # Locale('de_DE')
+        user.locale  # Locale('de', territory='DE')
+
+
+    Locale identifiers are parsed with `babel.Locale.parse` and the Locale
+    objects are interned, so each locale is loaded only once.
 
     """
 
@@ -67,9 +72,9 @@ class LocaleType(types.TypeDecorator, ScalarCoercible):
 
     def process_result_value(self, value, dialect):
         if value is not None:
-            return babel.Locale(value)
+            return i18n.parse_locale(value)
 
     def _coerce(self, value):
         if value is not None and not isinstance(value, babel.Locale):
-            return babel.Locale(value)
+            return i18n.parse_locale(value)
         return value
@@ -1,9 +1,13 @@
+import threading
 import weakref
+from functools import partial
 
 import six
+import sqlalchemy as sa
 from sqlalchemy import types
 from sqlalchemy.dialects import oracle, postgresql
 from sqlalchemy.ext.mutable import Mutable
+from sqlalchemy.orm.state import InstanceState
 
 from sqlalchemy_utils.exceptions import ImproperlyConfigured
 
@@ -13,10 +17,222 @@ passlib = None
 try:
     import passlib
     from passlib.context import CryptContext
+    from passlib.utils import consteq
 except ImportError:
     pass
 
 
+_contexts = {}
+_option_contexts = {}
+_max_lengths = weakref.WeakKeyDictionary()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _get_option_context(options):
+    """
+    Return a CryptContext constructed from given keyword arguments. Contexts
+    are shared between all password types with equal options.
+    """
+    try:
+        key = _freeze(options)
+        return _option_contexts[key]
+    except KeyError:
+        context = _option_contexts[key] = CryptContext(**options)
+        return context
+    except TypeError:
+        # Options contain unhashable values.
+        return CryptContext(**options)
+
+
+def _get_context(config):
+    try:
+        return _contexts[config]
+    except KeyError:
+        context = _contexts[config] = CryptContext.from_string(config)
+        return context
+
+
+def encrypt_password(config, secret):
+    """
+    Hash given secret using a CryptContext constructed from given
+    configuration string. This is used for hashing passwords in executors,
+    hence it needs to be a picklable module level function.
+    """
+    return _get_context(config).encrypt(secret)
+
+
+def verify_and_update_password(config, secret, hash):
+    """
+    Verify given secret against given hash using a CryptContext constructed
+    from given configuration string. Returns a tuple of verification result
+    and possibly updated hash.
+    """
+    return _get_context(config).verify_and_update(secret, hash)
+
+
+def _encrypt(context, executor, secret):
+    if executor is None:
+        hash = context.encrypt(secret)
+    else:
+        hash = executor.submit(
+            encrypt_password,
+            context.to_string(),
+            secret
+        ).result()
+    return hash.encode('utf8')
+
+
+def _to_bytes(value):
+    if isinstance(value, six.text_type):
+        return value.encode('utf8')
+    return value
+
+
+class RehashQueue(object):
+    """
+    Collects password hashes that were upgraded while verifying passwords of
+    persistent objects and writes them to the database in batched UPDATE
+    statements. Without a queue every upgraded hash marks the owning object
+    as modified and is written with its own UPDATE on the next flush.
+
+    ::
+
+        queue = RehashQueue(bind=engine, batch_size=500)
+
+
+        class User(Base):
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512', 'md5_crypt'],
+                deprecated=['md5_crypt'],
+                rehash_queue=queue
+            ))
+
+
+        # Write the upgraded hashes, for example periodically or when
+        # shutting down.
+        queue.upgrade_hashes()
+
+    :param bind:
+        Engine or connection used for writing the hashes. By default the
+        bind of the session of the verified object is used.
+    :param batch_size:
+        Number of queued hashes that triggers writing the queue in the
+        executor.
+    :param executor:
+        Executor used for writing full queues in the background. If not
+        given the queue is only written by calling :meth:`upgrade_hashes`.
+    """
+
+    def __init__(self, bind=None, batch_size=100, executor=None):
+        self.bind = bind
+        self.batch_size = batch_size
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def __len__(self):
+        return sum(len(hashes) for hashes in self._pending.values())
+
+    def add(self, state, key, old_hash, hash):
+        """
+        Queue given upgraded hash of given attribute of given persistent
+        object. Returns False if the hash could not be queued.
+
+        :param state: InstanceState of the object
+        :param key: key of the password attribute
+        :param old_hash: hash the upgraded hash replaces
+        :param hash: upgraded hash
+        """
+        if not state.has_identity:
+            return False
+        bind = self.bind
+        if bind is None:
+            if state.session is None:
+                return False
+            bind = state.session.get_bind(state.mapper)
+
+        mapper = state.mapper
+        column = mapper.get_property(key).columns[0]
+        identity = dict(
+            (mapper.get_property_by_column(pk_column).key, value)
+            for pk_column, value in zip(mapper.primary_key, state.identity)
+        )
+        primary_key = tuple(
+            identity[mapper.get_property_by_column(pk_column).key]
+            for pk_column in column.table.primary_key.columns
+        )
+
+        with self._lock:
+            hashes = self._pending.setdefault((bind, column), {})
+            if primary_key in hashes:
+                # The stored hash is still the one queued first.
+                old_hash = hashes[primary_key][0]
+            hashes[primary_key] = (old_hash, hash)
+            full = len(self) >= self.batch_size
+
+        # Hashes are queued while verifying passwords, possibly within a
+        # transaction holding locks on the rows, hence full queues are never
+        # written synchronously.
+        if full and self.executor is not None:
+            self.executor.submit(self.upgrade_hashes)
+        return True
+
+    def upgrade_hashes(self, bind=None):
+        """
+        Write all queued hashes using one executemany UPDATE per password
+        column. A hash is only written if the stored hash is still the hash
+        it replaces, hence passwords changed after queueing the hash are not
+        overwritten. Returns the number of processed hashes.
+
+        :param bind:
+            Engine or connection to use instead of the bind the hashes were
+            queued with.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        count = 0
+        for (default_bind, column), hashes in pending.items():
+            pk_columns = list(column.table.primary_key.columns)
+            criteria = [
+                pk_column == sa.bindparam('_pk_%d' % index)
+                for index, pk_column in enumerate(pk_columns)
+            ]
+            criteria.append(
+                column == sa.bindparam('_old_hash', type_=column.type.impl)
+            )
+            query = column.table.update().where(sa.and_(*criteria)).values({
+                column: sa.bindparam('_hash', type_=column.type.impl)
+            })
+            params = []
+            for primary_key, (old_hash, hash) in hashes.items():
+                row = dict(
+                    ('_pk_%d' % index, value)
+                    for index, value in enumerate(primary_key)
+                )
+                row['_old_hash'] = old_hash
+                row['_hash'] = hash
+                params.append(row)
+
+            connection = (bind or default_bind).connect()
+            try:
+                with connection.begin():
+                    connection.execute(query, params)
+            finally:
+                connection.close()
+            count += len(params)
+        return count
+
+
 class Password(Mutable, object):
 
     @classmethod
@@ -29,21 +245,146 @@ class Password(Mutable, object):
 
         super(Password, cls).coerce(key, value)
 
-    def __init__(self, value, context=None, secret=False):
+    def __init__(
+        self,
+        value,
+        context=None,
+        secret=False,
+        executor=None,
+        rehash_queue=None
+    ):
         # Store the hash (if it is one).
-        self.hash = value if not secret else None
+        self._hash = value if not secret else None
 
-        # Store the secret if we have one.
+        # Store the secret if we have one. The secret is hashed lazily on
+        # first access of the hash or when the owning object is flushed.
         self.secret = value if secret else None
 
         # The hash should be bytes.
-        if isinstance(self.hash, six.text_type):
-            self.hash = self.hash.encode('utf8')
+        if isinstance(self._hash, six.text_type):
+            self._hash = self._hash.encode('utf8')
 
         # Save weakref of the password context (if we have one)
         self.context = weakref.proxy(context) if context is not None else None
 
+        # Executor used for verifying the password (if we have one)
+        self.executor = executor
+
+        # Queue for upgraded hashes (if we have one)
+        self.rehash_queue = rehash_queue
+
+    @property
+    def is_pending(self):
+        """
+        Whether or not this password has a secret that is not hashed yet.
+        """
+        return self._hash is None and self.secret is not None
+
+    @property
+    def hash(self):
+        if self.is_pending and self.context is not None:
+            self.hash = _encrypt(self.context, self.executor, self.secret)
+        return self._hash
+
+    @hash.setter
+    def hash(self, value):
+        self._hash = value
+        self.secret = None
+
+    def _update_hash(self, new):
+        # New hash was calculated due to various reasons; stored one
+        # wasn't optimal, etc.
+        old = self._hash
+        self.hash = new
+
+        # The hash should be bytes.
+        if isinstance(self.hash, six.string_types):
+            self.hash = self.hash.encode('utf8')
+            if not self._queue_rehash(old):
+                self.changed()
+
+    def _queue_rehash(self, old_hash):
+        # Hashes of persistent objects are written in batches by the rehash
+        # queue instead of flushing every owning object.
+        if self.rehash_queue is None or not self._parents:
+            return False
+        for parent, key in list(self._parents.items()):
+            if isinstance(parent, InstanceState):
+                state = parent
+            else:
+                state = sa.inspect(parent)
+            if not self.rehash_queue.add(state, key, old_hash, self._hash):
+                return False
+        return True
+
+    def _verify_and_update(self, value):
+        if self.executor is None:
+            return self.context.verify_and_update(value, self.hash)
+        return self.executor.submit(
+            verify_and_update_password,
+            self.context.to_string(),
+            value,
+            self.hash
+        ).result()
+
+    def verify_async(self, secret, loop=None):
+        """
+        Verify given secret without blocking the asyncio event loop. The
+        verification is run in the executor of the password type (or in the
+        default executor of the event loop). Returns an awaitable resolving
+        to the verification result.
+
+        ::
+
+            if await user.password.verify_async(secret):
+                ...
+
+        :param secret: password secret to verify
+        :param loop: asyncio event loop, defaults to the current event loop
+        """
+        import asyncio
+
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        result = loop.create_future()
+
+        if self.is_pending or self._hash is None or self.context is None:
+            # Pending secrets are compared directly without hashing them.
+            result.set_result(self == secret)
+            return result
+
+        def verified(future):
+            if result.done():
+                # The caller cancelled the result, for example due to a
+                # timeout.
+                return
+            if future.cancelled():
+                result.cancel()
+            elif future.exception() is not None:
+                result.set_exception(future.exception())
+            else:
+                valid, new = future.result()
+                if valid and new:
+                    self._update_hash(new)
+                result.set_result(valid)
+
+        loop.run_in_executor(
+            self.executor,
+            verify_and_update_password,
+            self.context.to_string(),
+            secret,
+            self.hash
+        ).add_done_callback(verified)
+        return result
+
     def __eq__(self, value):
+        if self.is_pending and isinstance(
+            value,
+            (six.string_types, six.binary_type)
+        ):
+            # Compare secrets directly instead of hashing the pending one.
+            return consteq(_to_bytes(self.secret), _to_bytes(value))
+
         if self.hash is None or value is None:
             # Ensure that we don't continue comparison if one of us is None.
             return self.hash is value
@@ -58,16 +399,9 @@ class Password(Mutable, object):
             return value == self
 
         if isinstance(value, (six.string_types, six.binary_type)):
-            valid, new = self.context.verify_and_update(value, self.hash)
+            valid, new = self._verify_and_update(value)
             if valid and new:
-                # New hash was calculated due to various reasons; stored one
-                # wasn't optimal, etc.
-                self.hash = new
-
-                # The hash should be bytes.
-                if isinstance(self.hash, six.string_types):
-                    self.hash = self.hash.encode('utf8')
-                    self.changed()
+                self._update_hash(new)
 
             return valid
 
@@ -82,8 +416,10 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
     PasswordType hashes passwords as they come into the database and allows
     verifying them using a pythonic interface.
 
-    All keyword arguments (aside from max_length) are forwarded to the
-    construction of a `passlib.context.CryptContext` object.
+    All keyword arguments (aside from max_length, executor and rehash_queue)
+    are forwarded to the construction of a `passlib.context.CryptContext`
+    object. Password types with equal arguments share the same context, hence
+    the context should not be modified afterwards.
 
     The following usage will create a password column that will
     automatically hash new passwords as `pbkdf2_sha512` but still compare
@@ -116,33 +452,78 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
         target.password == 'b'
         # True
 
+
+    Hashing is CPU intensive. Hashing and verifying can be run in an
+    executor, for example a process pool, by giving the executor with the
+    `executor` argument. Passwords can also be verified without blocking an
+    asyncio event loop using :meth:`Password.verify_async`.
+
+    ::
+
+        from concurrent.futures import ProcessPoolExecutor
+
+
+        class Model(Base):
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512'],
+                executor=ProcessPoolExecutor()
+            ))
+
+
+        valid = await target.password.verify_async('b')
+
+
+    Upgraded hashes of deprecated schemes can be written in batches instead
+    of one UPDATE per verified object by giving a :class:`RehashQueue` with
+    the `rehash_queue` argument.
+
     """
 
     impl = types.VARBINARY(1024)
     python_type = Password
 
-    def __init__(self, max_length=None, **kwargs):
+    def __init__(
+        self,
+        max_length=None,
+        executor=None,
+        rehash_queue=None,
+        **kwargs
+    ):
         # Fail if passlib is not found.
         if passlib is None:
             raise ImproperlyConfigured(
                 "'passlib' is required to use 'PasswordType'"
             )
 
-        # Construct the passlib crypt context.
-        self.context = CryptContext(**kwargs)
+        # Get the (shared) passlib crypt context.
+        self.context = _get_option_context(kwargs)
+        self.executor = executor
+        self.rehash_queue = rehash_queue
 
-        if max_length is None:
-            max_length = self.calculate_max_length()
+        # The max length is calculated lazily when it is needed.
+        self._length = max_length
 
-        # Set the length to the now-calculated max length.
-        self.length = max_length
+    @property
+    def length(self):
+        if self._length is None:
+            try:
+                self._length = _max_lengths[self.context]
+            except KeyError:
+                self._length = _max_lengths[self.context] = (
+                    self.calculate_max_length()
+                )
+        return self._length
+
+    @length.setter
+    def length(self, value):
+        self._length = value
 
     def calculate_max_length(self):
         # Calculate the largest possible encoded password.
         # name + rounds + salt + hash + ($ * 4) of largest hash
         max_lengths = [1024]
         for name in self.context.schemes():
-            scheme = getattr(__import__('passlib.hash').hash, name)
+            scheme = self.context.handler(name)
             length = 4 + len(scheme.name)
             length += len(str(getattr(scheme, 'max_rounds', '')))
             length += (getattr(scheme, 'max_salt_size', 0) or 0)
@@ -170,22 +551,48 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
         impl = types.VARBINARY(self.length)
         return dialect.type_descriptor(impl)
 
+    def encrypt(self, secret):
+        """
+        Hash given secret using the default scheme. Returns the hash as bytes.
+        """
+        return _encrypt(self.context, self.executor, secret)
+
+    def encrypt_many(self, secrets):
+        """
+        Hash given secrets using the default scheme. If the type has an
+        executor the secrets are hashed in parallel. Returns a list of hashes
+        as bytes.
+        """
+        if self.executor is None:
+            hashes = [self.context.encrypt(secret) for secret in secrets]
+        else:
+            hashes = self.executor.map(
+                partial(encrypt_password, self.context.to_string()),
+                secrets
+            )
+        return [hash.encode('utf8') for hash in hashes]
+
     def process_bind_param(self, value, dialect):
         if isinstance(value, Password):
             # If were given a password secret; encrypt it.
             if value.secret is not None:
-                return self.context.encrypt(value.secret).encode('utf8')
+                return self.encrypt(value.secret)
 
             # Value has already been hashed.
             return value.hash
 
         if isinstance(value, six.string_types):
             # Assume value has not been hashed.
-            return self.context.encrypt(value).encode('utf8')
+            return self.encrypt(value)
 
     def process_result_value(self, value, dialect):
         if value is not None:
-            return Password(value, self.context)
+            return Password(
+                value,
+                self.context,
+                executor=self.executor,
+                rehash_queue=self.rehash_queue
+            )
 
     def _coerce(self, value):
 
@@ -193,18 +600,20 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
             return
 
         if not isinstance(value, Password):
-            # Hash the password using the default scheme.
-            value = self.context.encrypt(value).encode('utf8')
-            return Password(value, context=self.context)
+            # The password is hashed lazily using the default scheme.
+            return Password(
+                value,
+                context=self.context,
+                secret=True,
+                executor=self.executor,
+                rehash_queue=self.rehash_queue
+            )
 
         else:
             # If were given a password object; ensure the context is right.
             value.context = weakref.proxy(self.context)
-
-            # If were given a password secret; encrypt it.
-            if value.secret is not None:
-                value.hash = self.context.encrypt(value.secret).encode('utf8')
-                value.secret = None
+            value.executor = self.executor
+            value.rehash_queue = self.rehash_queue
 
         return value
 
@@ -214,3 +623,50 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
 
 
 Password.associate_with(PasswordType)
+
+
+_password_keys = weakref.WeakKeyDictionary()
+
+
+def password_listener(mapper, class_):
+    """
+    Collects the keys and types of all PasswordType properties of given
+    mapper, hence flushes only check those properties for pending secrets.
+    """
+    keys = [
+        (prop.key, prop.columns[0].type)
+        for prop in mapper.column_attrs
+        if isinstance(prop.columns[0].type, PasswordType)
+    ]
+    if keys:
+        _password_keys[mapper] = keys
+
+
+def hash_pending_passwords(session, flush_context, instances):
+    """
+    Hashes the pending password secrets of all new and dirty objects of given
+    session. The secrets are hashed in batches per password type, in
+    parallel if the type has an executor.
+    """
+    if not _password_keys:
+        return
+    pending = {}
+    for obj in list(session.new) + list(session.dirty):
+        keys = _password_keys.get(sa.inspect(obj).mapper)
+        if keys is None:
+            continue
+        for key, type_ in keys:
+            value = obj.__dict__.get(key)
+            if isinstance(value, Password) and value.is_pending:
+                pending.setdefault(type_, []).append(value)
+
+    for type_, passwords in pending.items():
+        hashes = type_.encrypt_many(
+            [password.secret for password in passwords]
+        )
+        for password, hash in zip(passwords, hashes):
+            password.hash = hash
+
+
+sa.event.listen(sa.orm.mapper, 'mapper_configured', password_listener)
+sa.event.listen(sa.orm.Session, 'before_flush', hash_pending_passwords)
@@ -1,3 +1,11 @@
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+import re
+import threading
+
 from sqlalchemy import types
 
 from sqlalchemy_utils.exceptions import ImproperlyConfigured
@@ -13,6 +21,61 @@ except ImportError:
     BasePhoneNumber = object
 
 
+#: Maximum number of parsed phone numbers kept in the parse cache.
+PARSE_CACHE_SIZE = 4096
+
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+_e164_regex = re.compile(r'^\+[1-9][0-9]{2,14}$')
+
+
+def _parse_e164(raw_number):
+    """
+    Parse given phone number without libphonenumber if it is a canonical
+    E.164 number. Returns None if the number is not one.
+    """
+    if not _e164_regex.match(raw_number):
+        return None
+    for length in (1, 2, 3):
+        country_code = int(raw_number[1:length + 1])
+        if country_code in phonenumbers.COUNTRY_CODE_TO_REGION_CODE:
+            national_number = raw_number[length + 1:]
+            if len(national_number) < 2 or national_number[0] == '0':
+                # Leading zeros need the full parser.
+                return None
+            return BasePhoneNumber(
+                country_code=country_code,
+                national_number=int(national_number)
+            )
+
+
+def _parse(raw_number, country_code):
+    """
+    Parse given phone number using a LRU cache keyed on the raw number and
+    the country code.
+    """
+    key = (raw_number, country_code)
+    with _parse_cache_lock:
+        try:
+            phone_number = _parse_cache.pop(key)
+        except KeyError:
+            pass
+        else:
+            _parse_cache[key] = phone_number
+            return phone_number
+
+    phone_number = (
+        _parse_e164(raw_number) or
+        phonenumbers.parse(raw_number, country_code)
+    )
+    with _parse_cache_lock:
+        _parse_cache[key] = phone_number
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return phone_number
+
+
 @str_coercible
 class PhoneNumber(BasePhoneNumber):
     '''
@@ -21,7 +84,8 @@ class PhoneNumber(BasePhoneNumber):
     in templates. Phone number validation method is also implemented.
 
     Takes the raw phone number and country code as params and parses them
-    into a PhoneNumber object.
+    into a PhoneNumber object. Parsed phone numbers are cached and the
+    formats are computed on first access.
 
     .. _Python phonenumbers library:
        https://github.com/daviddrysdale/python-phonenumbers
@@ -37,33 +101,43 @@ class PhoneNumber(BasePhoneNumber):
             raise ImproperlyConfigured(
                 "'phonenumbers' is required to use 'PhoneNumber'")
 
-        self._phone_number = phonenumbers.parse(raw_number, country_code)
+        phone_number = _parse(raw_number, country_code)
         super(PhoneNumber, self).__init__(
-            country_code=self._phone_number.country_code,
-            national_number=self._phone_number.national_number,
-            extension=self._phone_number.extension,
-            italian_leading_zero=self._phone_number.italian_leading_zero,
-            raw_input=self._phone_number.raw_input,
-            country_code_source=self._phone_number.country_code_source,
+            country_code=phone_number.country_code,
+            national_number=phone_number.national_number,
+            extension=phone_number.extension,
+            italian_leading_zero=phone_number.italian_leading_zero,
+            raw_input=phone_number.raw_input,
+            country_code_source=phone_number.country_code_source,
             preferred_domestic_carrier_code=(
-                self._phone_number.preferred_domestic_carrier_code
+                phone_number.preferred_domestic_carrier_code
             )
         )
-        self.national = phonenumbers.format_number(
-            self._phone_number,
-            phonenumbers.PhoneNumberFormat.NATIONAL
-        )
-        self.international = phonenumbers.format_number(
-            self._phone_number,
-            phonenumbers.PhoneNumberFormat.INTERNATIONAL
-        )
-        self.e164 = phonenumbers.format_number(
-            self._phone_number,
-            phonenumbers.PhoneNumberFormat.E164
-        )
+        self._formats = {}
+
+    def _format(self, number_format):
+        try:
+            return self._formats[number_format]
+        except KeyError:
+            value = self._formats[number_format] = (
+                phonenumbers.format_number(self, number_format)
+            )
+            return value
+
+    @property
+    def national(self):
+        return self._format(phonenumbers.PhoneNumberFormat.NATIONAL)
+
+    @property
+    def international(self):
+        return self._format(phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+
+    @property
+    def e164(self):
+        return self._format(phonenumbers.PhoneNumberFormat.E164)
 
     def is_valid_number(self):
-        return phonenumbers.is_valid_number(self._phone_number)
+        return phonenumbers.is_valid_number(self)
 
     def __unicode__(self):
         return self.national
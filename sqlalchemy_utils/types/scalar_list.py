@@ -1,6 +1,7 @@
 import six
 import sqlalchemy as sa
 from sqlalchemy import types
+from sqlalchemy.dialects import postgresql
 
 
 class ScalarListException(Exception):
@@ -50,30 +51,123 @@ class ScalarListType(types.TypeDecorator):
         session.commit()
 
 
+    Pass `native=True` to store the lists as native ARRAYs on PostgreSQL.
+    Other dialects still use the separator-separated text. Native columns
+    support the `contains` and `overlap` comparators, which can use GIN
+    indexes.
+
+    ::
+
+
+        class Player(Base):
+            __tablename__ = 'player'
+            id = sa.Column(sa.Integer, autoincrement=True)
+            points = sa.Column(ScalarListType(int, native=True))
+
+            __table_args__ = (
+                sa.Index('ix_player_points', points, postgresql_using='gin'),
+            )
+
+
+        session.query(Player).filter(Player.points.contains([11, 12]))
+        session.query(Player).filter(Player.points.overlap([8, 9]))
+
     """
 
     impl = sa.UnicodeText()
 
-    def __init__(self, coerce_func=six.text_type, separator=u','):
+    item_types = {
+        int: sa.Integer,
+        float: sa.Float,
+        six.text_type: sa.UnicodeText
+    }
+
+    class comparator_factory(types.TypeDecorator.Comparator):
+        def contains(self, other, **kwargs):
+            """
+            Return an expression that is true when the list contains all
+            elements of given list. Requires native ARRAY storage.
+            """
+            if not self.type.native:
+                return super(
+                    ScalarListType.comparator_factory,
+                    self
+                ).contains(other, **kwargs)
+            return self.expr.op('@>', is_comparison=True)(other)
+
+        def overlap(self, other):
+            """
+            Return an expression that is true when the list has any elements
+            in common with given list. Requires native ARRAY storage.
+            """
+            if not self.type.native:
+                raise ScalarListException(
+                    'The overlap comparator requires native ARRAY storage.'
+                )
+            return self.expr.op('&&', is_comparison=True)(other)
+
+    def __init__(
+        self,
+        coerce_func=six.text_type,
+        separator=u',',
+        native=False,
+        item_type=None
+    ):
+        """
+        :param coerce_func: Function used for coercing the list items.
+        :param separator: Separator used for text storage.
+        :param native: Whether to use native ARRAYs on PostgreSQL.
+        :param item_type:
+            Type of the native ARRAY items. By default the type is derived
+            from `coerce_func`.
+        """
         self.separator = six.text_type(separator)
         self.coerce_func = coerce_func
+        self.native = native
+        # The driver already returns items of the types in item_types, hence
+        # they need to be coerced only if the item type is given explicitly.
+        self.coerce_items = (
+            item_type is not None or coerce_func not in self.item_types
+        )
+        if item_type is None:
+            item_type = self.item_types.get(coerce_func, sa.UnicodeText)
+        self.item_type = item_type
+
+    def _is_native(self, dialect):
+        return self.native and dialect.name == 'postgresql'
+
+    def load_dialect_impl(self, dialect):
+        if self._is_native(dialect):
+            return dialect.type_descriptor(postgresql.ARRAY(self.item_type))
+        return dialect.type_descriptor(self.impl)
 
     def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        if self._is_native(dialect):
+            return [self.coerce_func(item) for item in value]
+
         # Convert list of values to unicode separator-separated list
         # Example: [1, 2, 3, 4] -> u'1, 2, 3, 4'
-        if value is not None:
-            if any(self.separator in six.text_type(item) for item in value):
+        items = []
+        for item in value:
+            item = six.text_type(item)
+            if self.separator in item:
                 raise ScalarListException(
                     "List values can't contain string '%s' (its being used as "
                     "separator. If you wish for scalar list values to contain "
                     "these strings, use a different separator string.)"
                     % self.separator
                 )
-            return self.separator.join(
-                map(six.text_type, value)
-            )
+            items.append(item)
+        return self.separator.join(items)
 
     def process_result_value(self, value, dialect):
+        if value is not None and self._is_native(dialect):
+            if self.coerce_items:
+                return list(map(self.coerce_func, value))
+            return list(value)
+
         if value is not None:
             if value == u'':
                 return []
@@ -1,9 +1,30 @@
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+import threading
+
 import six
 from sqlalchemy import types
 
 from sqlalchemy_utils.exceptions import ImproperlyConfigured
 
 from .scalar_coercible import ScalarCoercible
+from .timezone_ids import ZONE_NAMES
+
+#: Maximum number of time zone objects kept in the zone cache.
+ZONE_CACHE_SIZE = 1024
+
+_zones = OrderedDict()
+_zones_lock = threading.Lock()
+
+
+def _get_zone_ids(zone_names):
+    return dict((name, index) for index, name in enumerate(zone_names))
+
+
+_zone_ids = _get_zone_ids(ZONE_NAMES)
 
 
 class TimezoneType(types.TypeDecorator, ScalarCoercible):
@@ -24,18 +45,51 @@ class TimezoneType(types.TypeDecorator, ScalarCoercible):
             # Pass backend='pytz' to change it to use pytz (dateutil by
             # default)
             timezone = sa.Column(TimezoneType(backend='pytz'))
+
+
+    The 'zoneinfo' backend uses the standard library zoneinfo module (or the
+    backports.zoneinfo package on older Python versions). The resolved
+    timezone objects are cached and shared between all TimezoneType columns.
+
+    Timezones can also be stored as small integers by giving an integer type
+    as the `impl` argument. The integers are indexes of a stable table of
+    timezone names, which defaults to
+    ``sqlalchemy_utils.types.timezone_ids.ZONE_NAMES``.
+
+    ::
+
+        class Event(Base):
+            __tablename__ = 'event'
+
+            timezone = sa.Column(
+                TimezoneType(backend='zoneinfo', impl=sa.SmallInteger())
+            )
     """
 
     impl = types.Unicode(50)
 
     python_type = None
 
-    def __init__(self, backend='dateutil'):
+    def __init__(self, backend='dateutil', impl=None, zone_names=ZONE_NAMES):
         """
-        :param backend: Whether to use 'dateutil' or 'pytz' for timezones.
+        :param backend:
+            Whether to use 'dateutil', 'pytz' or 'zoneinfo' for timezones.
+        :param impl:
+            Type used for storing the timezones. Integer types store the
+            timezones as indexes of `zone_names`.
+        :param zone_names:
+            Sequence of timezone names used for integer storage. Names may
+            only be appended to it, as the indexes are stored in databases.
         """
 
         self.backend = backend
+        if impl is not None:
+            self.impl = types.to_instance(impl)
+        self.zone_names = zone_names
+        if zone_names is ZONE_NAMES:
+            self.zone_ids = _zone_ids
+        else:
+            self.zone_ids = _get_zone_ids(zone_names)
         if backend == 'dateutil':
             try:
                 from dateutil.tz import tzfile
@@ -43,6 +97,9 @@ class TimezoneType(types.TypeDecorator, ScalarCoercible):
 
                 self.python_type = tzfile
                 self._to = gettz
+                # dateutil has no public API for the name of a tzfile. Its
+                # own repr uses _filename too, which dateutil.zoneinfo.gettz
+                # sets to the zone name.
                 self._from = lambda x: six.text_type(x._filename)
 
             except ImportError:
@@ -65,15 +122,48 @@ class TimezoneType(types.TypeDecorator, ScalarCoercible):
                     "for 'TimezoneType'"
                 )
 
+        elif backend == 'zoneinfo':
+            try:
+                from zoneinfo import ZoneInfo
+            except ImportError:
+                try:
+                    from backports.zoneinfo import ZoneInfo
+                except ImportError:
+                    raise ImproperlyConfigured(
+                        "'zoneinfo' or 'backports.zoneinfo' is required to "
+                        "use the 'zoneinfo' backend for 'TimezoneType'"
+                    )
+
+            self.python_type = ZoneInfo
+            self._to = ZoneInfo
+            self._from = lambda x: six.text_type(x.key)
+
         else:
             raise ImproperlyConfigured(
-                "'pytz' or 'dateutil' are the backends supported for "
-                "'TimezoneType'"
+                "'pytz', 'dateutil' or 'zoneinfo' are the backends supported "
+                "for 'TimezoneType'"
             )
 
+    @property
+    def is_integer(self):
+        return isinstance(self.impl, types.Integer)
+
+    def _get_zone(self, name):
+        key = (self.backend, name)
+        try:
+            return _zones[key]
+        except KeyError:
+            zone = self._to(name)
+            if zone is not None:
+                with _zones_lock:
+                    _zones[key] = zone
+                    while len(_zones) > ZONE_CACHE_SIZE:
+                        _zones.popitem(last=False)
+            return zone
+
     def _coerce(self, value):
         if value and not isinstance(value, self.python_type):
-            obj = self._to(value)
+            obj = self._get_zone(value)
             if obj is None:
                 raise ValueError("unknown time zone '%s'" % value)
 
@@ -82,7 +172,21 @@ class TimezoneType(types.TypeDecorator, ScalarCoercible):
         return value
 
     def process_bind_param(self, value, dialect):
-        return self._from(self._coerce(value)) if value else None
+        if not value:
+            return None
+        name = self._from(self._coerce(value))
+        if self.is_integer:
+            try:
+                return self.zone_ids[name]
+            except KeyError:
+                raise ValueError(
+                    "time zone '%s' has no integer id" % name
+                )
+        return name
 
     def process_result_value(self, value, dialect):
-        return self._to(value) if value else None
+        if value is None:
+            return None
+        if self.is_integer:
+            return self._get_zone(self.zone_names[value])
+        return self._get_zone(value) if value else None
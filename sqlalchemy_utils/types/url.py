@@ -1,6 +1,8 @@
 furl = None
+BaseURL = object
 try:
     from furl import furl
+    BaseURL = furl
 except ImportError:
     pass
 import six
@@ -9,6 +11,77 @@ from sqlalchemy import types
 from .scalar_coercible import ScalarCoercible
 
 
+class LazyURL(BaseURL):
+    """
+    A furl object that stores the raw URL string and parses it only when
+    the URL is accessed or modified for the first time. Converting a LazyURL
+    to string returns the raw string until the URL is modified.
+
+    LazyURL objects compare and hash by their normalized URLs, hence
+    comparing and hashing parse the URL.
+
+    :param url: URL string
+    """
+    def __init__(self, url=''):
+        if not isinstance(url, six.string_types):
+            url = six.text_type(url)
+        object.__setattr__(self, '_raw', url)
+        object.__setattr__(self, '_loaded', False)
+
+    @property
+    def is_loaded(self):
+        """
+        Whether or not the URL has been parsed.
+        """
+        return self._loaded
+
+    def _load(self):
+        object.__setattr__(self, '_loaded', True)
+        furl.__init__(self, self._raw)
+        object.__setattr__(self, '_loaded_url', furl.tostr(self))
+
+    def _normalized(self):
+        if not self._loaded:
+            self._load()
+        return furl.tostr(self)
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set, hence the furl
+        # attributes are loaded on first access.
+        if name.startswith('__') or self.__dict__.get('_loaded', True):
+            raise AttributeError(name)
+        self._load()
+        return getattr(self, name)
+
+    def __setattr__(self, name, value):
+        if not self._loaded:
+            self._load()
+        furl.__setattr__(self, name, value)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyURL):
+            return self._normalized() == other._normalized()
+        if isinstance(other, furl):
+            return self._normalized() == other.url
+        return furl.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._normalized())
+
+    def __unicode__(self):
+        if not self._loaded:
+            return self._raw
+        url = furl.__unicode__(self)
+        # The raw string is returned as long as the URL is not modified, also
+        # through its nested path and query objects.
+        if url == self._loaded_url:
+            return self._raw
+        return url
+
+
 class URLType(types.TypeDecorator, ScalarCoercible):
     """
     URLType stores furl_ objects into database.
@@ -36,6 +109,11 @@ class URLType(types.TypeDecorator, ScalarCoercible):
 
         print user.website
         # www.example.com?some_argument=12
+
+
+    The URLs loaded from the database are :class:`LazyURL` objects, which
+    parse the URL only when it is accessed. URLs that are not accessed are
+    written back to the database as they were loaded.
     """
 
     impl = types.UnicodeText
@@ -52,14 +130,14 @@ class URLType(types.TypeDecorator, ScalarCoercible):
             return value
 
         if value is not None:
-            return furl(value)
+            return LazyURL(value)
 
     def _coerce(self, value):
         if furl is None:
             return value
 
         if value is not None and not isinstance(value, furl):
-            return furl(value)
+            return LazyURL(value)
         return value
 
     @property
@@ -1,5 +1,9 @@
 from __future__ import absolute_import
 
+import binascii
+import os
+import threading
+import time
 import uuid
 
 from sqlalchemy import types
@@ -7,6 +11,63 @@ from sqlalchemy.dialects import postgresql
 
 from .scalar_coercible import ScalarCoercible
 
+_uuid7_state = {'timestamp': 0, 'counter': 0}
+_uuid7_lock = threading.Lock()
+
+
+def _random_bits(count):
+    return int(binascii.hexlify(os.urandom(8)), 16) >> (64 - count)
+
+
+def uuid7():
+    """
+    Return a time-ordered version 7 UUID. The UUID starts with a 48-bit Unix
+    timestamp in milliseconds, followed by a 12-bit counter that keeps UUIDs
+    generated within the same millisecond ordered, and 62 random bits.
+
+    Time-ordered UUIDs keep inserts to primary key indexes local, unlike
+    random version 4 UUIDs. They can be used as column defaults::
+
+        from sqlalchemy_utils import UUIDType, uuid7
+
+
+        class User(Base):
+            __tablename__ = 'user'
+
+            id = sa.Column(UUIDType, default=uuid7, primary_key=True)
+    """
+    timestamp = int(time.time() * 1000)
+    with _uuid7_lock:
+        if timestamp > _uuid7_state['timestamp']:
+            # Seed the counter randomly, leaving room for increments.
+            counter = _random_bits(11)
+        else:
+            timestamp = _uuid7_state['timestamp']
+            counter = _uuid7_state['counter'] + 1
+            if counter > 0xfff:
+                timestamp += 1
+                counter = _random_bits(11)
+        _uuid7_state['timestamp'] = timestamp
+        _uuid7_state['counter'] = counter
+
+    return uuid.UUID(int=(
+        (timestamp & 0xffffffffffff) << 80 |
+        0x7 << 76 |
+        counter << 64 |
+        0x2 << 62 |
+        _random_bits(62)
+    ))
+
+
+def _time_first(value):
+    # Move the time_hi_and_version and time_mid fields of a version 1 UUID
+    # before the time_low field.
+    return value[6:8] + value[4:6] + value[0:4] + value[8:]
+
+
+def _time_last(value):
+    return value[4:8] + value[2:4] + value[0:2] + value[8:]
+
 
 class UUIDType(types.TypeDecorator, ScalarCoercible):
     """
@@ -23,17 +84,44 @@ class UUIDType(types.TypeDecorator, ScalarCoercible):
 
             # Pass `binary=False` to fallback to CHAR instead of BINARY
             id = sa.Column(UUIDType(binary=False), primary_key=True)
+
+    Random version 4 UUIDs scatter inserts over primary key indexes.
+    Time-ordered version 7 UUIDs generated by :func:`uuid7` keep the
+    timestamp first in all storage formats. Version 1 UUIDs store the least
+    significant part of the timestamp first. Pass `ordered=True` to store the
+    timestamp fields of binary UUIDs with the most significant part first,
+    like ``UUID_TO_BIN(uuid, 1)`` of MySQL does.
+
+    ::
+
+        class Event(Base):
+            __tablename__ = 'event'
+
+            id = sa.Column(
+                UUIDType(ordered=True),
+                default=uuid.uuid1,
+                primary_key=True
+            )
+
+    UUID objects returned natively by the database driver, for example by
+    psycopg2 after calling ``psycopg2.extras.register_uuid()``, are used as
+    they are.
     """
     impl = types.BINARY(16)
 
     python_type = uuid.UUID
 
-    def __init__(self, binary=True, native=True):
+    def __init__(self, binary=True, native=True, ordered=False):
         """
         :param binary: Whether to use a BINARY(16) or CHAR(32) fallback.
+        :param native: Whether to use the native UUID type of PostgreSQL.
+        :param ordered:
+            Whether to store the timestamp fields of BINARY(16) values with
+            the most significant part first.
         """
         self.binary = binary
         self.native = native
+        self.ordered = ordered
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql' and self.native:
@@ -56,6 +144,31 @@ class UUIDType(types.TypeDecorator, ScalarCoercible):
 
         return value
 
+    def _uses_native_uuid(self, dialect):
+        return (
+            self.native and
+            dialect.name == 'postgresql' and
+            getattr(dialect, 'use_native_uuid', False)
+        )
+
+    def _bind_converter(self, dialect):
+        if self.native and dialect.name == 'postgresql':
+            return str
+        if self.binary and self.ordered:
+            return lambda value: _time_first(value.bytes)
+        if self.binary:
+            return lambda value: value.bytes
+        return lambda value: value.hex
+
+    def _result_converter(self, dialect):
+        if self.native and dialect.name == 'postgresql':
+            return uuid.UUID
+        if self.binary and self.ordered:
+            return lambda value: uuid.UUID(bytes=_time_last(value))
+        if self.binary:
+            return lambda value: uuid.UUID(bytes=value)
+        return uuid.UUID
+
     def process_bind_param(self, value, dialect):
         if value is None:
             return value
@@ -63,16 +176,52 @@ class UUIDType(types.TypeDecorator, ScalarCoercible):
         if not isinstance(value, uuid.UUID):
             value = self._coerce(value)
 
-        if self.native and dialect.name == 'postgresql':
-            return str(value)
-
-        return value.bytes if self.binary else value.hex
+        return self._bind_converter(dialect)(value)
 
     def process_result_value(self, value, dialect):
-        if value is None:
+        if value is None or isinstance(value, uuid.UUID):
             return value
 
-        if self.native and dialect.name == 'postgresql':
-            return uuid.UUID(value)
+        return self._result_converter(dialect)(value)
 
-        return uuid.UUID(bytes=value) if self.binary else uuid.UUID(value)
+    def bind_processor(self, dialect):
+        # The processors are specialized for the dialect once instead of
+        # checking the dialect for every value.
+        coerce = self._coerce
+        if self._uses_native_uuid(dialect):
+            # The driver adapts UUID objects natively.
+            convert = impl_processor = None
+        else:
+            convert = self._bind_converter(dialect)
+            impl_processor = self.load_dialect_impl(dialect).bind_processor(
+                dialect
+            )
+
+        def process(value):
+            if value is None:
+                return value
+            if not isinstance(value, uuid.UUID):
+                value = coerce(value)
+            if convert:
+                value = convert(value)
+            if impl_processor:
+                value = impl_processor(value)
+            return value
+        return process
+
+    def result_processor(self, dialect, coltype):
+        convert = self._result_converter(dialect)
+        impl_processor = self.load_dialect_impl(dialect).result_processor(
+            dialect,
+            coltype
+        )
+
+        def process(value):
+            if value is None or isinstance(value, uuid.UUID):
+                # Drivers may return UUID objects natively, for example
+                # psycopg2 after psycopg2.extras.register_uuid().
+                return value
+            if impl_processor:
+                value = impl_processor(value)
+            return convert(value)
+        return process
@@ -9,6 +9,33 @@ from .bit import BitType
 from .scalar_coercible import ScalarCoercible
 
 
+def _to_mask(days):
+    if isinstance(days, WeekDay):
+        return 1 << days.index
+    return WeekDays(days).mask
+
+
+class WeekDaysComparator(types.Integer.Comparator):
+    def includes(self, days):
+        """
+        Return an expression that is true when the week days include all
+        of given days.
+
+        :param days: WeekDay, WeekDays or a bit string
+        """
+        mask = _to_mask(days)
+        return self.expr.op('&')(mask) == mask
+
+    def overlaps(self, days):
+        """
+        Return an expression that is true when the week days include any
+        of given days.
+
+        :param days: WeekDay, WeekDays or a bit string
+        """
+        return self.expr.op('&')(_to_mask(days)) != 0
+
+
 class WeekDaysType(types.TypeDecorator, ScalarCoercible):
     """
     WeekDaysType offers way of saving WeekDays objects into database. The
@@ -48,6 +75,30 @@ class WeekDaysType(types.TypeDecorator, ScalarCoercible):
         schedule.working_days = '1110000'
         schedule.working_days  # WeekDays object
 
+
+    The week days can also be stored as integer masks by giving an integer
+    type as the `impl` argument. Integer columns can be filtered by week days
+    in the database using bitwise operators.
+
+    ::
+
+
+        class Schedule(Base):
+            __tablename__ = 'schedule'
+            id = sa.Column(sa.Integer, autoincrement=True)
+            working_days = sa.Column(WeekDaysType(impl=sa.SmallInteger()))
+
+
+        # Schedules including Monday and Tuesday
+        session.query(Schedule).filter(
+            Schedule.working_days.includes('1100000')
+        )
+
+        # Schedules including Saturday or Sunday
+        session.query(Schedule).filter(
+            Schedule.working_days.overlaps('0000011')
+        )
+
     """
 
     impl = BitType(WeekDay.NUM_WEEK_DAYS)
@@ -58,13 +109,27 @@ class WeekDaysType(types.TypeDecorator, ScalarCoercible):
                 "'babel' package is required to use 'WeekDaysType'"
             )
 
+        impl = kwargs.pop('impl', None)
         super(WeekDaysType, self).__init__(*args, **kwargs)
+        if impl is not None:
+            self.impl = types.to_instance(impl)
+
+    @property
+    def is_integer(self):
+        return isinstance(self.impl, types.Integer)
 
     @property
     def comparator_factory(self):
+        if self.is_integer:
+            return WeekDaysComparator
         return self.impl.comparator_factory
 
     def process_bind_param(self, value, dialect):
+        if self.is_integer:
+            if value is None or isinstance(value, six.integer_types):
+                return value
+            return WeekDays(value).mask
+
         if isinstance(value, WeekDays):
             return value.as_bit_string()
 
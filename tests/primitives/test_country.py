@@ -1,3 +1,5 @@
+import pickle
+
 import six
 from pytest import mark, raises
 
@@ -12,6 +14,18 @@ class TestCountry(object):
     def test_init(self):
         assert Country(u'FI') == Country(Country(u'FI'))
 
+    def test_interning(self):
+        assert Country('FI') is Country(u'FI')
+        assert Country(Country('FI')) is Country('FI')
+
+    def test_code_is_read_only(self):
+        with raises(AttributeError):
+            Country('FI').code = 'SE'
+        assert Country('FI').code == 'FI'
+
+    def test_pickle(self):
+        assert pickle.loads(pickle.dumps(Country('FI'))) is Country('FI')
+
     def test_constructor_with_wrong_type(self):
         with raises(TypeError) as e:
             Country(None)
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import pickle
+
 import six
 from pytest import mark, raises
 
@@ -13,6 +15,18 @@ class TestCurrency(object):
     def test_init(self):
         assert Currency('USD') == Currency(Currency('USD'))
 
+    def test_interning(self):
+        assert Currency('USD') is Currency(u'USD')
+        assert Currency(Currency('USD')) is Currency('USD')
+
+    def test_code_is_read_only(self):
+        with raises(AttributeError):
+            Currency('USD').code = 'EUR'
+        assert Currency('USD').code == 'USD'
+
+    def test_pickle(self):
+        assert pickle.loads(pickle.dumps(Currency('USD'))) is Currency('USD')
+
     def test_hashability(self):
         assert len(set([Currency('USD'), Currency('USD')])) == 1
 
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from pytest import mark, raises
+
+from sqlalchemy_utils import (
+    clear_locale_cache,
+    Country,
+    Currency,
+    i18n,
+    prewarm_locale_cache
+)
+from sqlalchemy_utils.primitives import locale_cache
+
+
+@mark.skipif('i18n.babel is None')
+class TestLocaleCache(object):
+    def setup_method(self, method):
+        i18n.get_locale = lambda: i18n.babel.Locale('en')
+        clear_locale_cache()
+
+    def teardown_method(self, method):
+        clear_locale_cache()
+
+    def test_names_are_cached_on_first_use(self):
+        assert Country('FI').name == u'Finland'
+        assert Currency('USD').name == u'US Dollar'
+        assert Currency('USD').symbol == u'$'
+
+        assert 'en' in locale_cache._country_names
+        assert 'en' in locale_cache._currency_names
+        assert 'en' in locale_cache._currency_symbols
+
+    def test_unhashable_locales(self):
+        class Locale(i18n.babel.Locale):
+            __hash__ = None
+
+        i18n.get_locale = lambda: Locale('en')
+        assert Country('FI').name == u'Finland'
+        i18n.get_locale = lambda: Locale('en')
+        assert Country('SE').name == u'Sweden'
+        assert list(locale_cache._country_names) == ['en']
+
+    def test_names_for_different_locales(self):
+        assert Country('FI').name == u'Finland'
+        i18n.get_locale = lambda: i18n.babel.Locale('fi')
+        assert Country('FI').name == u'Suomi'
+        assert len(locale_cache._country_names) == 2
+
+    def test_prewarm_locale_cache(self):
+        prewarm_locale_cache(['fi', i18n.babel.Locale('sv')])
+
+        assert locale_cache.get_country_name('FI', 'fi') == u'Suomi'
+        assert locale_cache.get_currency_name('EUR', 'fi') == u'euro'
+        assert 'fi' in locale_cache._currency_symbols
+        assert 'sv' in locale_cache._country_names
+
+    def test_unknown_country_name(self):
+        with raises(KeyError):
+            locale_cache.get_country_name('SomeUnknownCode')
+
+    def test_unknown_currency_symbol(self):
+        assert locale_cache.get_currency_symbol('XYZ') == 'XYZ'
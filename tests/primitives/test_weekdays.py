@@ -86,7 +86,20 @@ class TestWeekDay(object):
 class TestWeekDays(object):
     def test_constructor_with_valid_bit_string(self):
         days = WeekDays('1000100')
-        assert days._days == set([WeekDay(0), WeekDay(4)])
+        assert days.mask == 17
+
+    def test_constructor_with_mask(self):
+        days = WeekDays(17)
+        assert days.as_bit_string() == '1000100'
+
+    @pytest.mark.parametrize('mask', [-1, 128])
+    def test_constructor_with_invalid_mask(self, mask):
+        with pytest.raises(ValueError):
+            WeekDays(mask)
+
+    def test_constructor_with_week_days(self):
+        days = WeekDays([WeekDay(0), WeekDay(4)])
+        assert days.as_bit_string() == '1000100'
 
     @pytest.mark.parametrize(
         'bit_string',
@@ -106,7 +119,7 @@ class TestWeekDays(object):
     def test_constructor_with_another_week_days_object(self):
         days = WeekDays('0000000')
         another_days = WeekDays(days)
-        assert days._days == another_days._days
+        assert days.mask == another_days.mask
 
     def test_representation(self):
         days = WeekDays('0000000')
@@ -148,6 +161,20 @@ class TestWeekDays(object):
         days = WeekDays('0001000')
         assert days != 0
 
+    def test_contains(self):
+        days = WeekDays('1000100')
+        assert WeekDay(0) in days
+        assert WeekDay(1) not in days
+        assert 0 not in days
+
+    def test_union(self):
+        days = WeekDays('1000100') | WeekDays('0100100')
+        assert days == '1100100'
+
+    def test_intersection(self):
+        days = WeekDays('1000100') & WeekDays('0100100')
+        assert days == '0000100'
+
     def test_iterator_starts_from_locales_first_week_day(self):
         i18n.get_locale = lambda: flexmock(first_week_day=1)
         days = WeekDays('1111111')
@@ -105,3 +105,85 @@ class TestTranslationHybrid(TestCase):
             locale = sa.Column(sa.String)
 
         Article.name
+
+    def test_load_option_loads_only_current_translation(self):
+        city = self.City(name_translations={'fi': 'Helsinki', 'en': 'Hki'})
+        self.session.add(city)
+        self.session.commit()
+        self.session.expunge_all()
+
+        city = self.session.query(self.City).options(
+            self.translation_hybrid.load_option(self.City.name_translations)
+        ).first()
+        assert 'name_translations' not in city.__dict__
+        assert city.name == 'Helsinki'
+
+    def test_load_option_falls_back_to_default_translation(self):
+        city = self.City(name_translations={'en': 'Helsinki'})
+        self.session.add(city)
+        self.session.commit()
+        self.session.expunge_all()
+
+        city = self.session.query(self.City).options(
+            self.translation_hybrid.load_option(self.City.name_translations)
+        ).first()
+        assert city.name == 'Helsinki'
+
+    def test_load_option_uses_default_value(self):
+        self.translation_hybrid.default_value = 'Some value'
+        self.session.add(self.City(name_translations={}))
+        self.session.commit()
+        self.session.expunge_all()
+
+        city = self.session.query(self.City).options(
+            self.translation_hybrid.load_option(self.City.name_translations)
+        ).first()
+        assert city.name == 'Some value'
+
+    def test_loaded_translations_take_precedence_over_projection(self):
+        self.session.add(self.City(name_translations={'fi': 'Helsinki'}))
+        self.session.commit()
+        self.session.expunge_all()
+
+        city = self.session.query(self.City).options(
+            self.translation_hybrid.load_option(self.City.name_translations)
+        ).first()
+        city.name = 'Stadi'
+        assert city.name_translations['fi'] == 'Stadi'
+        assert city.name == 'Stadi'
+
+    def test_indexes(self):
+        indexes = self.translation_hybrid.indexes(
+            self.City.name_translations,
+            ['fi', 'en']
+        )
+        assert [index.name for index in indexes] == [
+            'ix_city_name_translations_fi',
+            'ix_city_name_translations_en'
+        ]
+        ddl = sa.schema.CreateIndex(indexes[0])
+        assert str(ddl.compile(dialect=self.engine.dialect)) == (
+            'CREATE INDEX ix_city_name_translations_fi ON city '
+            "(coalesce(name_translations -> 'fi', name_translations -> 'en'))"
+        )
+
+    def test_hybrid_expression_matches_index_expression(self):
+        index = self.translation_hybrid.indexes(
+            self.City.name_translations,
+            ['fi']
+        )[0]
+        index.create(bind=self.connection)
+        self.session.add(self.City(name_translations={'fi': 'Helsinki'}))
+        self.session.commit()
+        query = self.session.query(self.City.id).filter(
+            self.City.name == 'Helsinki'
+        )
+        sql = str(query.statement.compile(
+            dialect=self.engine.dialect,
+            compile_kwargs={'literal_binds': True}
+        ))
+        self.connection.execute('SET enable_seqscan = off')
+        plan = ' '.join(
+            row[0] for row in self.connection.execute('EXPLAIN ' + sql)
+        )
+        assert 'ix_city_name_translations_fi' in plan
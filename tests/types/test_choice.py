@@ -80,6 +80,40 @@ class TestChoiceTypeWithCustomUnderlyingType(TestCase):
         assert type_.impl == sa.Integer
 
 
+class TestChoiceTypeWithIntegerCodes(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            TYPES = [
+                (0, u'Admin'),
+                (1, u'Regular user')
+            ]
+
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            type = sa.Column(ChoiceType(TYPES, impl=sa.SmallInteger()))
+
+        self.User = User
+
+    def test_parameter_processing(self):
+        self.session.add_all([self.User(type=0), self.User(type=1)])
+        self.session.commit()
+        self.session.expunge_all()
+
+        users = self.session.query(self.User).order_by(self.User.id).all()
+        assert users[0].type == Choice(0, u'Admin')
+        assert users[0].type.value == u'Admin'
+        assert users[1].type.value == u'Regular user'
+
+    def test_choices_are_interned(self):
+        self.session.add_all([self.User(type=1), self.User(type=1)])
+        self.session.commit()
+        self.session.expunge_all()
+
+        users = self.session.query(self.User).all()
+        assert users[0].type is users[1].type
+        assert self.User(type=1).type is users[0].type
+
+
 @mark.skipif('Enum is None')
 class TestEnumType(TestCase):
     def create_models(self):
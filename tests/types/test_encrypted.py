@@ -1,11 +1,24 @@
+import os
 from datetime import date, datetime, time
 
 import pytest
+import six
 import sqlalchemy as sa
+from flexmock import flexmock
 from pytest import mark
 
-from sqlalchemy_utils import ColorType, EncryptedType, PhoneNumberType
-from sqlalchemy_utils.types.encrypted import AesEngine, FernetEngine
+from sqlalchemy_utils import (
+    ColorType,
+    EncryptedType,
+    PhoneNumberType,
+    reencrypt
+)
+from sqlalchemy_utils.types.encrypted import (
+    AesEngine,
+    AesGcmEngine,
+    EncryptedValue,
+    FernetEngine
+)
 from tests import TestCase
 
 cryptography = None
@@ -180,6 +193,29 @@ class EncryptedTypeTestCase(TestCase):
     def test_enum(self, user):
         assert user.enum == self.user_enum
 
+    def test_process_result_values(self):
+        type_ = self.User.__table__.c.accounts_num.type
+        dialect = self.session.bind.dialect
+        values = [type_.process_bind_param(i, dialect) for i in range(5)]
+        values.append(None)
+        assert type_.process_result_values(values, dialect) == (
+            [0, 1, 2, 3, 4, None]
+        )
+
+    def test_process_result_values_with_executor(self):
+        futures = pytest.importorskip('concurrent.futures')
+        type_ = self.User.__table__.c.username.type
+        dialect = self.session.bind.dialect
+        names = [six.text_type(i) for i in range(25)]
+        values = [type_.process_bind_param(name, dialect) for name in names]
+        with futures.ThreadPoolExecutor(4) as executor:
+            assert type_.process_result_values(
+                values,
+                dialect,
+                executor=executor,
+                chunk_size=10
+            ) == names
+
     def test_lookup_key(self):
         # Add teams
         self._team_key = 'one'
@@ -239,6 +275,354 @@ class TestAesEncryptedTypeTestcase(EncryptedTypeTestCase):
         assert test.username == user.username
 
 
+class TestAesGcmEncryptedTypeTestCase(EncryptedTypeTestCase):
+
+    encryption_engine = AesGcmEngine
+
+    def test_encrypting_same_value_gives_different_ciphertexts(self):
+        engine = AesGcmEngine()
+        engine._update_key(self.test_key)
+        assert engine.encrypt('value') != engine.encrypt('value')
+
+    def test_stores_raw_bytes(self):
+        engine = AesGcmEngine()
+        engine._update_key(self.test_key)
+        encrypted = engine.encrypt('value')
+        assert len(encrypted) == (
+            AesGcmEngine.NONCE_SIZE + len('value') + AesGcmEngine.TAG_SIZE
+        )
+
+    def test_cipher_api_fallback_is_compatible(self):
+        engine = AesGcmEngine()
+        engine._update_key(self.test_key)
+        encrypted = engine.encrypt('value')
+        aesgcm = engine.aesgcm
+        engine.aesgcm = None
+        assert engine.decrypt(encrypted) == 'value'
+        encrypted = engine.encrypt('value')
+        engine.aesgcm = aesgcm
+        assert engine.decrypt(encrypted) == 'value'
+
+    def test_tampered_value_raises(self):
+        from cryptography.exceptions import InvalidTag
+
+        engine = AesGcmEngine()
+        engine._update_key(self.test_key)
+        encrypted = bytearray(engine.encrypt('value'))
+        encrypted[AesGcmEngine.NONCE_SIZE] ^= 1
+        with pytest.raises(InvalidTag):
+            engine.decrypt(bytes(encrypted))
+
+
 class TestFernetEncryptedTypeTestCase(EncryptedTypeTestCase):
 
     encryption_engine = FernetEngine
+
+
+@mark.skipif('cryptography is None')
+class TestEncryptionEngineKeyCache(object):
+
+    @mark.parametrize(
+        'engine_class',
+        (AesEngine, AesGcmEngine, FernetEngine)
+    )
+    def test_engine_initialized_only_when_key_changes(self, engine_class):
+        engine = engine_class()
+        flexmock(engine).should_call('_initialize_engine').times(2)
+        for i in range(3):
+            engine._update_key('secretkey1234')
+        engine._update_key('otherkey')
+        engine._update_key('otherkey')
+
+    def test_derived_keys_are_cached(self):
+        engine = AesEngine()
+        engine._update_key('one')
+        key_one = engine.secret_key
+        engine._update_key('two')
+        assert engine._derived_keys[b'one'] is key_one
+        engine._update_key('one')
+        assert engine.secret_key is key_one
+
+    def test_encrypt_with_alternating_keys(self):
+        engine = AesEngine()
+        engine._update_key('one')
+        encrypted = engine.encrypt('value')
+        engine._update_key('two')
+        assert engine.encrypt('value') != encrypted
+        engine._update_key('one')
+        assert engine.decrypt(encrypted) == 'value'
+
+
+@mark.skipif('cryptography is None')
+class TestEncryptedTypeBlindIndex(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            email = sa.Column(EncryptedType(
+                sa.Unicode,
+                'secretkey1234',
+                AesGcmEngine,
+                blind_index='email_index'
+            ))
+            email_index = sa.Column(sa.LargeBinary(32), index=True)
+
+        self.User = User
+
+    def create_user(self, email):
+        user = self.User(email=email)
+        self.session.add(user)
+        self.session.commit()
+        return user
+
+    def test_blind_index_is_set_on_insert(self):
+        user = self.create_user(u'john@example.com')
+        assert user.email_index == self.User.email.type.blind_index_value(
+            u'john@example.com',
+            self.session.bind.dialect
+        )
+
+    def test_blind_index_is_updated_on_update(self):
+        user = self.create_user(u'john@example.com')
+        index = user.email_index
+        user.email = u'jack@example.com'
+        self.session.commit()
+        assert user.email_index != index
+        assert self.session.query(self.User).filter(
+            self.User.email == u'jack@example.com'
+        ).one() is user
+
+    def test_equality_compares_blind_index_column(self):
+        assert 'email_index = ' in str(
+            self.User.email == u'john@example.com'
+        )
+
+    def test_equality_lookup(self):
+        user = self.create_user(u'john@example.com')
+        self.create_user(u'jack@example.com')
+        assert self.session.query(self.User).filter(
+            self.User.email == u'john@example.com'
+        ).one() is user
+
+    def test_inequality_lookup(self):
+        self.create_user(u'john@example.com')
+        user = self.create_user(u'jack@example.com')
+        assert self.session.query(self.User).filter(
+            self.User.email != u'john@example.com'
+        ).one() is user
+
+    def test_in_lookup(self):
+        user = self.create_user(u'john@example.com')
+        user2 = self.create_user(u'jack@example.com')
+        self.create_user(u'jill@example.com')
+        users = self.session.query(self.User).filter(
+            self.User.email.in_([u'john@example.com', u'jack@example.com'])
+        ).order_by(self.User.id).all()
+        assert users == [user, user2]
+
+    def test_notin_lookup(self):
+        self.create_user(u'john@example.com')
+        user = self.create_user(u'jack@example.com')
+        assert self.session.query(self.User).filter(
+            self.User.email.notin_([u'john@example.com'])
+        ).one() is user
+
+    def test_comparison_to_none(self):
+        user = self.create_user(None)
+        assert user.email_index is None
+        assert self.session.query(self.User).filter(
+            self.User.email == None  # noqa
+        ).one() is user
+
+
+@mark.skipif('cryptography is None')
+class TestEncryptedTypeKeyRotation(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode,
+                'key3',
+                AesGcmEngine,
+                key_id='v3',
+                previous_keys={None: 'key1', 'v2': 'key2'}
+            ))
+
+        self.User = User
+
+    def insert_users(self, usernames, key, key_id=None):
+        type_ = EncryptedType(sa.Unicode, key, AesGcmEngine, key_id=key_id)
+        dialect = self.session.bind.dialect
+        for username in usernames:
+            self.session.execute(self.User.__table__.insert().values(
+                username=sa.literal(
+                    type_.process_bind_param(username, dialect),
+                    sa.LargeBinary
+                )
+            ))
+
+    def usernames(self):
+        self.session.expunge_all()
+        return [
+            user.username
+            for user in self.session.query(self.User).order_by(self.User.id)
+        ]
+
+    def stored_values(self):
+        return [
+            row[0] for row in self.session.query(
+                sa.type_coerce(self.User.username, sa.LargeBinary)
+            ).order_by(self.User.id)
+        ]
+
+    def test_values_are_prefixed_with_key_id(self):
+        self.session.add(self.User(username=u'someone'))
+        self.session.commit()
+        assert self.stored_values()[0].startswith(b'v3:')
+
+    def test_decrypts_values_with_previous_keys(self):
+        self.insert_users([u'1'], 'key1')
+        self.insert_users([u'2'], 'key2', 'v2')
+        self.insert_users([u'3'], 'key3', 'v3')
+        assert self.usernames() == [u'1', u'2', u'3']
+
+    def test_legacy_value_starting_with_key_id_prefix(self):
+        nonce = b'v3:' + b'\x00' * (AesGcmEngine.NONCE_SIZE - 3)
+        flexmock(os).should_receive('urandom').and_return(nonce)
+        self.insert_users([u'1'], 'key1')
+        self.insert_users([u'2'], 'key2', 'v2')
+        flexmock(os).should_receive('urandom').and_return(
+            b'\x00' * AesGcmEngine.NONCE_SIZE
+        )
+        assert self.stored_values()[0].startswith(b'v3:')
+        assert self.usernames() == [u'1', u'2']
+        assert reencrypt(self.session, self.User.username) == 2
+        assert self.usernames() == [u'1', u'2']
+
+    def test_reencrypt(self):
+        self.insert_users([u'1', u'2', u'3'], 'key1')
+        self.insert_users([u'4', u'5'], 'key2', 'v2')
+        self.insert_users([None], 'key2', 'v2')
+        count = reencrypt(self.session, self.User.username, batch_size=2)
+        assert count == 5
+        assert all(
+            value.startswith(b'v3:')
+            for value in self.stored_values()
+            if value is not None
+        )
+        assert self.usernames() == [u'1', u'2', u'3', u'4', u'5', None]
+
+    def test_reencrypt_with_explicit_keys(self):
+        self.insert_users([u'1', u'2'], 'other')
+        reencrypt(self.session, self.User.username, 'other', 'key3')
+        assert self.usernames() == [u'1', u'2']
+
+    def test_reencrypt_with_executor(self):
+        futures = pytest.importorskip('concurrent.futures')
+        usernames = [six.text_type(i) for i in range(20)]
+        self.insert_users(usernames, 'key1')
+        with futures.ThreadPoolExecutor(4) as executor:
+            reencrypt(
+                self.session,
+                self.User.username,
+                batch_size=8,
+                executor=executor
+            )
+        assert self.usernames() == usernames
+
+
+@mark.skipif('cryptography is None')
+class TestReencryptBlindIndex(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode,
+                'key2',
+                AesGcmEngine,
+                blind_index='username_index'
+            ))
+            username_index = sa.Column(sa.LargeBinary(32))
+
+        self.User = User
+
+    def test_reencrypt_updates_blind_index(self):
+        type_ = EncryptedType(sa.Unicode, 'key1', AesGcmEngine)
+        dialect = self.session.bind.dialect
+        self.session.execute(self.User.__table__.insert().values(
+            username=sa.literal(
+                type_.process_bind_param(u'someone', dialect),
+                sa.LargeBinary
+            )
+        ))
+        reencrypt(self.session, self.User.username, 'key1', 'key2')
+        user = self.session.query(self.User).filter(
+            self.User.username == u'someone'
+        ).one()
+        assert user.username == u'someone'
+
+
+@mark.skipif('cryptography is None')
+class TestLazyEncryptedType(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(50))
+            username = sa.Column(EncryptedType(
+                sa.Unicode,
+                'secretkey1234',
+                lazy=True
+            ))
+            accounts_num = sa.Column(EncryptedType(
+                sa.Integer,
+                'secretkey1234',
+                lazy=True
+            ))
+
+        self.User = User
+
+    def load_user(self, **kwargs):
+        self.session.add(self.User(**kwargs))
+        self.session.commit()
+        self.session.expunge_all()
+        return self.session.query(self.User).first()
+
+    def test_returns_proxy(self):
+        user = self.load_user(username=u'someone')
+        assert isinstance(user.username, EncryptedValue)
+        assert not user.username.is_decrypted
+
+    def test_value_not_decrypted_unless_accessed(self):
+        flexmock(AesEngine).should_receive('decrypt').never()
+        user = self.load_user(name=u'Someone', username=u'someone')
+        assert user.name == u'Someone'
+
+    def test_decrypts_on_access(self):
+        user = self.load_user(username=u'someone', accounts_num=2)
+        assert user.username == u'someone'
+        assert user.username.is_decrypted
+        assert user.username.value == u'someone'
+        assert user.accounts_num.value == 2
+        assert user.accounts_num > 1
+
+    def test_decrypts_only_once(self):
+        user = self.load_user(username=u'someone')
+        flexmock(AesEngine).should_call('decrypt').once()
+        assert user.username == u'someone'
+        assert user.username.upper() == u'SOMEONE'
+        assert six.text_type(user.username) == u'someone'
+
+    def test_none(self):
+        user = self.load_user(username=None)
+        assert user.username is None
+
+    def test_proxy_can_be_assigned_to_other_objects(self):
+        user = self.load_user(username=u'someone')
+        self.session.add(self.User(name=u'Copy', username=user.username))
+        self.session.commit()
+        self.session.expunge_all()
+        copy = self.session.query(self.User).filter_by(name=u'Copy').one()
+        assert copy.username == u'someone'
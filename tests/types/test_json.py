@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import json as stdlib_json
+
 import sqlalchemy as sa
 from pytest import mark
 
@@ -57,3 +59,150 @@ class TestSqliteJSONType(JSONTestCase):
 @mark.skipif('json.json is None')
 class TestPostgresJSONType(JSONTestCase):
     dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+
+def dumps_to_bytes(value):
+    return stdlib_json.dumps(value, sort_keys=True).encode('utf8')
+
+
+@mark.skipif('json.json is None')
+class TestJSONTypeWithCustomCodec(TestCase):
+    def create_models(self):
+        class Document(self.Base):
+            __tablename__ = 'document'
+            id = sa.Column(sa.Integer, primary_key=True)
+            data = sa.Column(json.JSONType(
+                serializer=dumps_to_bytes,
+                deserializer=stdlib_json.loads
+            ))
+            binary_json = sa.Column(json.JSONType(
+                serializer=dumps_to_bytes,
+                deserializer=stdlib_json.loads,
+                impl=sa.LargeBinary()
+            ))
+
+        self.Document = Document
+
+    def test_text_storage(self):
+        self.session.add(self.Document(data={'b': 1, 'a': u'\xe4'}))
+        self.session.commit()
+
+        assert self.session.execute(
+            'SELECT data FROM document'
+        ).scalar() == u'{"a": "\\u00e4", "b": 1}'
+        document = self.session.query(self.Document).first()
+        assert document.data == {'a': u'\xe4', 'b': 1}
+
+    def test_binary_storage(self):
+        self.session.add(self.Document(binary_json={'b': 1, 'a': 2}))
+        self.session.commit()
+
+        assert self.session.execute(
+            'SELECT binary_json FROM document'
+        ).scalar() == b'{"a": 2, "b": 1}'
+        document = self.session.query(self.Document).first()
+        assert document.binary_json == {'a': 2, 'b': 1}
+
+
+@mark.skipif('json.json is None')
+class TestPostgresJSONBType(TestCase):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def create_models(self):
+        class Document(self.Base):
+            __tablename__ = 'document'
+            id = sa.Column(sa.Integer, primary_key=True)
+            data = sa.Column(json.JSONType(jsonb=True))
+
+        json.json_gin_index(Document.__table__.c.data, path_ops=True)
+        json.json_path_index(Document.__table__.c.data, ['color', 'name'])
+        self.Document = Document
+
+    def setup_method(self, method):
+        TestCase.setup_method(self, method)
+        self.session.add_all([
+            self.Document(
+                data={'color': {'name': 'red'}, 'max-speed': 400}
+            ),
+            self.Document(data={'color': {'name': u"bl'ue"}}),
+        ])
+        self.session.commit()
+
+    def test_column_type(self):
+        assert self.session.execute(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'document' AND column_name = 'data'"
+        ).scalar() == 'jsonb'
+
+    def test_contains(self):
+        query = self.session.query(self.Document.id).filter(
+            self.Document.data.contains({'color': {'name': 'red'}})
+        )
+        assert query.count() == 1
+
+    def test_contained_by(self):
+        query = self.session.query(self.Document.id).filter(
+            self.Document.data.contained_by(
+                {'color': {'name': u"bl'ue"}, 'size': 1}
+            )
+        )
+        assert query.count() == 1
+
+    def test_has_key(self):
+        query = self.session.query(self.Document.id).filter(
+            self.Document.data.has_key('max-speed')  # noqa
+        )
+        assert query.count() == 1
+
+    def test_has_any_and_has_all(self):
+        Document = self.Document
+        assert self.session.query(Document.id).filter(
+            Document.data.has_any(['max-speed', 'size'])
+        ).count() == 1
+        assert self.session.query(Document.id).filter(
+            Document.data.has_all(['color', 'max-speed'])
+        ).count() == 1
+
+    def test_path(self):
+        assert self.session.query(
+            self.Document.data.path('color')
+        ).order_by(self.Document.id).all() == [
+            ({'name': 'red'}, ),
+            ({'name': u"bl'ue"}, )
+        ]
+
+    def test_path_text(self):
+        query = self.session.query(self.Document.id).filter(
+            self.Document.data.path_text('color', 'name') == u"bl'ue"
+        )
+        assert query.count() == 1
+
+    def test_path_text_matches_index_expression(self):
+        expr = self.Document.data.path_text('color', 'name')
+        index = [
+            index for index in self.Document.__table__.indexes
+            if index.name == 'ix_document_data_color_name'
+        ][0]
+        dialect = self.engine.dialect
+        index_expr = list(index.expressions)[0]
+        assert str(expr.compile(dialect=dialect)) == str(
+            index_expr.compile(dialect=dialect)
+        )
+
+    def test_index_definitions(self):
+        definitions = dict(self.session.execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename = 'document'"
+        ).fetchall())
+        assert 'gin (data jsonb_path_ops)' in (
+            definitions['ix_document_data']
+        )
+        assert "#>> '{color,name}'" in (
+            definitions['ix_document_data_color_name']
+        )
+
+
+class TestJSONPathLiteral(object):
+    def test_quotes_keys(self):
+        literal = json.path_literal([u'a"b', u"c'd", u'e\\f'], sa.UnicodeText)
+        assert literal.name == u"""'{"a\\"b","c''d","e\\\\f"}'"""
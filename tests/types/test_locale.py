@@ -1,6 +1,7 @@
 import sqlalchemy as sa
 from pytest import mark, raises
 
+from sqlalchemy_utils import i18n
 from sqlalchemy_utils.types import locale
 from tests import TestCase
 
@@ -36,3 +37,22 @@ class TestLocaleType(TestCase):
     def test_unknown_locale_throws_exception(self):
         with raises(locale.babel.UnknownLocaleError):
             self.User(locale=u'unknown')
+
+    def test_locales_are_interned(self):
+        self.session.add_all([
+            self.User(locale=u'fi'),
+            self.User(locale=u'fi')
+        ])
+        self.session.commit()
+        self.session.expunge_all()
+
+        users = self.session.query(self.User).all()
+        assert users[0].locale is users[1].locale
+        assert users[0].locale is i18n.parse_locale('fi')
+
+    def test_variant_strings_are_parsed(self):
+        user = self.User(locale=u'en_US')
+
+        assert user.locale.language == 'en'
+        assert user.locale.territory == 'US'
+        assert i18n.cast_locale(None, user.locale) == 'en_US'
@@ -1,10 +1,24 @@
+import os
+
 import sqlalchemy as sa
+from flexmock import flexmock
 from pytest import mark
 from sqlalchemy import inspect
 
 from sqlalchemy_utils import Password, PasswordType, types  # noqa
+from sqlalchemy_utils.types.password import (
+    encrypt_password,
+    RehashQueue,
+    verify_and_update_password
+)
 from tests import TestCase
 
+try:
+    import asyncio
+    from concurrent import futures
+except ImportError:
+    asyncio = None
+
 
 @mark.skipif('types.password.passlib is None')
 class TestPasswordType(TestCase):
@@ -70,6 +84,44 @@ class TestPasswordType(TestCase):
         assert obj.password == 'b'
         assert obj.password.hash.decode('utf8').startswith('$pbkdf2-sha512$')
 
+    def test_hashing_is_deferred_until_flush(self):
+        type_ = inspect(self.User).c.password.type
+        flexmock(type_.context).should_call('encrypt').once()
+        obj = self.User()
+        obj.password = 'a'
+        obj.password = 'b'
+        assert obj.password.is_pending
+        assert obj.password == 'b'
+        self.session.add(obj)
+        self.session.commit()
+        assert not obj.password.is_pending
+
+    def test_pending_passwords_are_hashed_in_batch(self):
+        type_ = inspect(self.User).c.password.type
+        flexmock(type_).should_call('encrypt_many').once()
+        self.session.add_all([
+            self.User(password='a'),
+            self.User(password='b')
+        ])
+        self.session.commit()
+
+        self.session.expunge_all()
+        users = self.session.query(self.User).order_by(self.User.id).all()
+        assert users[0].password == 'a'
+        assert users[1].password == 'b'
+
+    def test_flush_only_checks_password_properties(self):
+        class Article(self.Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+
+        sa.orm.configure_mappers()
+        password_keys = types.password._password_keys
+        assert [key for key, type_ in password_keys[
+            inspect(self.User)
+        ]] == ['password']
+        assert inspect(Article) not in password_keys
+
     def test_auto_column_length(self):
         """Should derive the correct column length from the specified schemes.
         """
@@ -90,6 +142,29 @@ class TestPasswordType(TestCase):
     def test_without_schemes(self):
         assert PasswordType(schemes=[]).length == 1024
 
+    def test_context_is_shared(self):
+        type_ = PasswordType(schemes=['pbkdf2_sha512', 'md5_crypt'])
+        other = PasswordType(schemes=['pbkdf2_sha512', 'md5_crypt'])
+
+        assert type_.context is other.context
+        assert PasswordType(schemes=['md5_crypt']).context is not (
+            type_.context
+        )
+
+    def test_max_length_is_calculated_lazily(self):
+        type_ = PasswordType(schemes=['sha256_crypt'], default='sha256_crypt')
+        # The max lengths are cached per shared context across tests.
+        types.password._max_lengths.pop(type_.context, None)
+        flexmock(type_).should_call('calculate_max_length').once()
+
+        assert type_.length == type_.length
+
+    def test_explicit_max_length(self):
+        type_ = PasswordType(schemes=['pbkdf2_sha512'], max_length=255)
+        flexmock(type_).should_call('calculate_max_length').never()
+
+        assert type_.length == 255
+
     def test_compare(self):
         from passlib.hash import md5_crypt
 
@@ -172,3 +247,291 @@ class TestPasswordType(TestCase):
 
         assert obj.password.hash.decode('utf8').startswith('$pbkdf2-sha512$')
         assert obj.password == 'b'
+
+
+@mark.skipif('types.password.passlib is None')
+class TestPasswordTypeWithRehashQueue(TestCase):
+    def create_models(self):
+        self.queue = RehashQueue(batch_size=3)
+
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512', 'md5_crypt'],
+                deprecated=['md5_crypt'],
+                rehash_queue=self.queue
+            ))
+
+        self.User = User
+
+    def create_users(self, count):
+        from passlib.hash import md5_crypt
+
+        for index in range(count):
+            self.session.add(
+                self.User(password=Password(md5_crypt.encrypt('b')))
+            )
+        self.session.commit()
+        self.session.expunge_all()
+        return self.session.query(self.User).order_by(self.User.id).all()
+
+    def stored_hashes(self):
+        return [
+            password.decode('utf8')
+            for password, in self.session.execute(
+                sa.select([sa.column('password')])
+                .select_from(sa.table('user'))
+                .order_by(sa.column('id'))
+            )
+        ]
+
+    def test_upgraded_hash_is_queued(self):
+        user, = self.create_users(1)
+
+        assert user.password == 'b'
+        assert user.password.hash.startswith(b'$pbkdf2-sha512$')
+        assert user not in self.session.dirty
+        assert len(self.queue) == 1
+        assert self.stored_hashes()[0].startswith('$1$')
+
+    def test_upgrade_hashes(self):
+        users = self.create_users(2)
+        for user in users:
+            assert user.password == 'b'
+
+        assert self.queue.upgrade_hashes() == 2
+        assert len(self.queue) == 0
+        for hash in self.stored_hashes():
+            assert hash.startswith('$pbkdf2-sha512$')
+
+        self.session.expire_all()
+        for user in users:
+            assert user.password == 'b'
+        assert len(self.queue) == 0
+
+    def test_changed_password_is_not_overwritten(self):
+        user, = self.create_users(1)
+        assert user.password == 'b'
+        assert len(self.queue) == 1
+
+        user.password = 'c'
+        self.session.commit()
+
+        assert self.queue.upgrade_hashes() == 1
+        self.session.expire_all()
+        assert user.password == 'c'
+        assert user.password != 'b'
+
+    def test_full_queue_is_not_written_synchronously(self):
+        users = self.create_users(4)
+        for user in users:
+            assert user.password == 'b'
+
+        assert len(self.queue) == 4
+        assert all(hash.startswith('$1$') for hash in self.stored_hashes())
+
+    def test_full_queue_is_written_in_executor(self):
+        executor = flexmock(submit=lambda func: func())
+        flexmock(executor).should_call('submit').once()
+        self.queue.executor = executor
+        users = self.create_users(4)
+        for user in users:
+            assert user.password == 'b'
+
+        assert len(self.queue) == 1
+        hashes = self.stored_hashes()
+        assert all(hash.startswith('$pbkdf2-sha512$') for hash in hashes[:3])
+        assert hashes[3].startswith('$1$')
+
+    def test_new_objects_are_flushed_by_orm(self):
+        from passlib.hash import md5_crypt
+
+        user = self.User(password=Password(md5_crypt.encrypt('b')))
+        self.session.add(user)
+
+        assert user.password == 'b'
+        assert len(self.queue) == 0
+
+        self.session.commit()
+
+        assert self.stored_hashes()[0].startswith('$pbkdf2-sha512$')
+
+
+@mark.skipif('types.password.passlib is None')
+class TestRehashQueueWithOpenTransaction(TestCase):
+    dns = 'sqlite:///sqlalchemy_utils_password.db'
+
+    def create_models(self):
+        self.queue = RehashQueue(batch_size=1)
+
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(255))
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512', 'md5_crypt'],
+                deprecated=['md5_crypt'],
+                rehash_queue=self.queue
+            ))
+
+        self.User = User
+
+    def teardown_method(self, method):
+        TestCase.teardown_method(self, method)
+        os.remove('sqlalchemy_utils_password.db')
+
+    def test_verification_does_not_write_full_queue(self):
+        from passlib.hash import md5_crypt
+
+        self.session.add(self.User(password=Password(md5_crypt.encrypt('b'))))
+        self.session.commit()
+        self.session.expunge_all()
+        user = self.session.query(self.User).first()
+        self.queue.bind = self.engine
+
+        user.name = u'someone'
+        self.session.flush()
+        assert user.password == 'b'
+        assert len(self.queue) == 1
+        self.session.commit()
+
+        assert self.queue.upgrade_hashes() == 1
+        self.session.expire_all()
+        assert user.password.hash.startswith(b'$pbkdf2-sha512$')
+
+
+@mark.skipif('types.password.passlib is None or asyncio is None')
+class TestPasswordTypeWithExecutor(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512', 'md5_crypt'],
+                deprecated=['md5_crypt'],
+                executor=self.executor
+            ))
+
+        self.User = User
+
+    def setup_method(self, method):
+        self.executor = futures.ThreadPoolExecutor(2)
+        TestCase.setup_method(self, method)
+
+    def teardown_method(self, method):
+        TestCase.teardown_method(self, method)
+        self.executor.shutdown()
+
+    def test_encrypt(self):
+        (
+            flexmock(self.executor)
+            .should_call('submit')
+            .with_args(encrypt_password, str, 'b')
+            .once()
+        )
+        obj = self.User()
+        obj.password = 'b'
+        assert obj.password.hash.startswith(b'$pbkdf2-sha512$')
+
+    def test_check(self):
+        obj = self.User(password='b')
+        self.session.add(obj)
+        self.session.commit()
+        obj = self.session.query(self.User).get(obj.id)
+
+        (
+            flexmock(self.executor)
+            .should_call('submit')
+            .with_args(verify_and_update_password, str, 'b', bytes)
+            .once()
+        )
+        assert obj.password == 'b'
+
+    def test_pending_passwords_are_hashed_in_parallel(self):
+        flexmock(self.executor).should_call('map').once()
+        self.session.add_all([
+            self.User(password='a'),
+            self.User(password='b')
+        ])
+        self.session.commit()
+        self.session.expunge_all()
+        users = self.session.query(self.User).order_by(self.User.id).all()
+        assert users[0].password == 'a'
+        assert users[1].password == 'b'
+
+    def test_process_pool(self):
+        self.executor.shutdown()
+        self.executor = futures.ProcessPoolExecutor(1)
+        type_ = PasswordType(schemes=['md5_crypt'], executor=self.executor)
+        password = type_._coerce('b')
+        assert password.hash.startswith(b'$1$')
+        assert password == 'b'
+        assert password != 'a'
+
+    def test_verify_async(self):
+        from passlib.hash import md5_crypt
+
+        obj = self.User()
+        obj.password = Password(md5_crypt.encrypt('b'))
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(obj.password.verify_async(
+                'b',
+                loop=loop
+            ))
+            assert not loop.run_until_complete(obj.password.verify_async(
+                'a',
+                loop=loop
+            ))
+        finally:
+            loop.close()
+        assert obj.password.hash.startswith(b'$pbkdf2-sha512$')
+
+    def test_cancel_verify_async(self):
+        from passlib.hash import md5_crypt
+
+        obj = self.User()
+        obj.password = Password(md5_crypt.encrypt('b'))
+        errors = []
+        loop = asyncio.new_event_loop()
+        loop.set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+        try:
+            result = obj.password.verify_async('b', loop=loop)
+            result.cancel()
+            self.executor.shutdown()
+            for index in range(3):
+                loop.run_until_complete(asyncio.sleep(0))
+        finally:
+            loop.close()
+        assert result.cancelled()
+        assert errors == []
+
+    def test_verify_async_does_not_hash_pending_secret(self):
+        flexmock(self.executor).should_receive('submit').never()
+        obj = self.User(password='b')
+        assert obj.password.is_pending
+        loop = asyncio.new_event_loop()
+        try:
+            result = obj.password.verify_async('b', loop=loop)
+            assert result.done()
+            assert loop.run_until_complete(result)
+            assert not loop.run_until_complete(
+                obj.password.verify_async('a', loop=loop)
+            )
+        finally:
+            loop.close()
+        assert obj.password.is_pending
+
+    def test_verify_async_without_executor(self):
+        type_ = PasswordType(schemes=['md5_crypt'])
+        password = type_._coerce('b')
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(
+                password.verify_async('b', loop=loop)
+            )
+        finally:
+            loop.close()
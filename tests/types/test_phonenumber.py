@@ -1,5 +1,6 @@
 import six
 import sqlalchemy as sa
+from flexmock import flexmock
 from pytest import mark
 
 from sqlalchemy_utils import PhoneNumber, PhoneNumberType, types  # noqa
@@ -52,6 +53,51 @@ class TestPhoneNumber(object):
         else:
             assert str(number) == number.national
 
+    def test_formats_are_computed_lazily(self):
+        phonenumbers = types.phone_number.phonenumbers
+        (
+            flexmock(phonenumbers)
+            .should_call('format_number')
+            .once()
+        )
+        number = PhoneNumber('+358401234567')
+        assert number.national == u'040 1234567'
+        assert number.national == u'040 1234567'
+
+    def test_parse_cache(self):
+        phonenumbers = types.phone_number.phonenumbers
+        PhoneNumber('040 7654321', 'FI')
+        flexmock(phonenumbers).should_receive('parse').never()
+
+        number = PhoneNumber('040 7654321', 'FI')
+        assert number.e164 == u'+358407654321'
+
+    def test_parse_cache_size(self):
+        types.phone_number._parse_cache.clear()
+        types.phone_number.PARSE_CACHE_SIZE = 2
+        try:
+            for raw_number in self.valid_phone_numbers:
+                PhoneNumber(raw_number, 'FI')
+            assert len(types.phone_number._parse_cache) == 2
+        finally:
+            types.phone_number.PARSE_CACHE_SIZE = 4096
+
+    @mark.parametrize(
+        'raw_number',
+        ['+358401234567', '+14155552671', '+390612345678', '+441212345678']
+    )
+    def test_e164_fast_path(self, raw_number):
+        phonenumbers = types.phone_number.phonenumbers
+        assert PhoneNumber(raw_number) == phonenumbers.parse(raw_number)
+
+    def test_e164_numbers_are_not_parsed(self):
+        phonenumbers = types.phone_number.phonenumbers
+        flexmock(phonenumbers).should_receive('parse').never()
+
+        number = PhoneNumber('+358409876543')
+        assert number.country_code == 358
+        assert number.national_number == 409876543
+
 
 @mark.skipif('types.phone_number.phonenumbers is None')
 class TestPhoneNumberType(TestCase):
@@ -2,7 +2,7 @@ import six
 import sqlalchemy as sa
 from pytest import raises
 
-from sqlalchemy_utils import ScalarListType
+from sqlalchemy_utils import ScalarListException, ScalarListType
 from tests import TestCase
 
 
@@ -29,6 +29,10 @@ class TestScalarIntegerList(TestCase):
         user = self.session.query(self.User).first()
         assert user.some_list == [1, 2, 3, 4]
 
+    def test_overlap_requires_native_storage(self):
+        with raises(ScalarListException):
+            self.User.some_list.overlap([1, 2])
+
 
 class TestScalarUnicodeList(TestCase):
     def create_models(self):
@@ -77,3 +81,95 @@ class TestScalarUnicodeList(TestCase):
 
         user = self.session.query(self.User).first()
         assert user.some_list == []
+
+
+class TestNativeScalarListOnSQLite(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            some_list = sa.Column(ScalarListType(int, native=True))
+
+        self.User = User
+
+    def test_falls_back_to_text(self):
+        self.session.add(self.User(some_list=[1, 2, 3]))
+        self.session.commit()
+
+        assert self.session.execute(
+            'SELECT some_list FROM "user"'
+        ).scalar() == u'1,2,3'
+        user = self.session.query(self.User).first()
+        assert user.some_list == [1, 2, 3]
+
+
+class TestNativeScalarListOnPostgres(TestCase):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            some_list = sa.Column(ScalarListType(int, native=True))
+            tags = sa.Column(ScalarListType(native=True))
+            codes = sa.Column(
+                ScalarListType(int, native=True, item_type=sa.String)
+            )
+
+            __table_args__ = (
+                sa.Index('ix_user_tags', tags, postgresql_using='gin'),
+            )
+
+        self.User = User
+
+    def test_save_list(self):
+        self.session.add(self.User(some_list=[1, 2, 3], tags=[u'a,b', u'c']))
+        self.session.commit()
+
+        assert self.session.execute(
+            'SELECT some_list FROM "user"'
+        ).scalar() == [1, 2, 3]
+        user = self.session.query(self.User).first()
+        assert user.some_list == [1, 2, 3]
+        assert user.tags == [u'a,b', u'c']
+
+    def test_explicit_item_type(self):
+        self.session.add(self.User(codes=[1, 2]))
+        self.session.commit()
+
+        assert self.session.execute(
+            'SELECT codes FROM "user"'
+        ).scalar() == ['1', '2']
+        self.session.expunge_all()
+        user = self.session.query(self.User).first()
+        assert user.codes == [1, 2]
+
+    def test_contains(self):
+        self.session.add_all([
+            self.User(id=1, some_list=[1, 2, 3], tags=[u'a', u'b']),
+            self.User(id=2, some_list=[3, 4], tags=[u'c'])
+        ])
+        self.session.commit()
+
+        query = self.session.query(self.User.id).order_by(self.User.id)
+        assert query.filter(
+            self.User.some_list.contains([1, 3])
+        ).all() == [(1, )]
+        assert query.filter(
+            self.User.tags.contains([u'c'])
+        ).all() == [(2, )]
+
+    def test_overlap(self):
+        self.session.add_all([
+            self.User(id=1, some_list=[1, 2, 3], tags=[u'a', u'b']),
+            self.User(id=2, some_list=[3, 4], tags=[u'c'])
+        ])
+        self.session.commit()
+
+        query = self.session.query(self.User.id).order_by(self.User.id)
+        assert query.filter(
+            self.User.some_list.overlap([3, 5])
+        ).all() == [(1, ), (2, )]
+        assert query.filter(
+            self.User.tags.overlap([u'b', u'd'])
+        ).all() == [(1, )]
@@ -1,8 +1,17 @@
 import sqlalchemy as sa
+from pytest import mark, raises
 
 from sqlalchemy_utils.types import timezone
 from tests import TestCase
 
+try:
+    import zoneinfo
+except ImportError:
+    try:
+        from backports import zoneinfo
+    except ImportError:
+        zoneinfo = None
+
 
 class TestTimezoneType(TestCase):
     def create_models(self):
@@ -39,3 +48,89 @@ class TestTimezoneType(TestCase):
 
         assert visitor_dateutil is not None
         assert visitor_pytz is not None
+
+    def test_zones_are_cached(self):
+        type_ = timezone.TimezoneType(backend='pytz')
+        other = timezone.TimezoneType(backend='pytz')
+        zone = type_.process_result_value(u'Europe/Helsinki', None)
+
+        assert other.process_result_value(u'Europe/Helsinki', None) is zone
+        assert timezone._zones[('pytz', u'Europe/Helsinki')] is zone
+
+    def test_unknown_zone(self):
+        type_ = timezone.TimezoneType(backend='dateutil')
+        with raises(ValueError):
+            type_._coerce(u'Unknown/Zone')
+
+
+@mark.skipif('zoneinfo is None')
+class TestTimezoneTypeWithZoneInfo(TestCase):
+    def create_models(self):
+        class Visitor(self.Base):
+            __tablename__ = 'visitor'
+            id = sa.Column(sa.Integer, primary_key=True)
+            timezone = sa.Column(timezone.TimezoneType(backend='zoneinfo'))
+
+        self.Visitor = Visitor
+
+    def test_parameter_processing(self):
+        self.session.add(self.Visitor(timezone=u'America/Los_Angeles'))
+        self.session.commit()
+
+        visitor = self.session.query(self.Visitor).filter_by(
+            timezone=u'America/Los_Angeles'
+        ).first()
+
+        assert visitor.timezone == zoneinfo.ZoneInfo('America/Los_Angeles')
+
+
+class TestTimezoneTypeWithInteger(TestCase):
+    def create_models(self):
+        class Visitor(self.Base):
+            __tablename__ = 'visitor'
+            id = sa.Column(sa.Integer, primary_key=True)
+            timezone = sa.Column(
+                timezone.TimezoneType(backend='pytz', impl=sa.SmallInteger())
+            )
+
+        self.Visitor = Visitor
+
+    def test_parameter_processing(self):
+        self.session.add(self.Visitor(timezone=u'Africa/Abidjan'))
+        self.session.add(self.Visitor(timezone=u'America/Los_Angeles'))
+        self.session.commit()
+
+        ids = [
+            row[0] for row in self.session.execute(
+                'SELECT timezone FROM visitor ORDER BY id'
+            )
+        ]
+        assert ids == [
+            0,
+            timezone.ZONE_NAMES.index(u'America/Los_Angeles')
+        ]
+
+        visitor = self.session.query(self.Visitor).filter_by(
+            timezone=u'America/Los_Angeles'
+        ).one()
+        assert str(visitor.timezone) == 'America/Los_Angeles'
+
+    def test_impl_class_is_instantiated(self):
+        type_ = timezone.TimezoneType(backend='pytz', impl=sa.SmallInteger)
+
+        assert isinstance(type_.impl, sa.SmallInteger)
+        assert type_.process_bind_param(u'UTC', None) == (
+            timezone.ZONE_NAMES.index(u'UTC')
+        )
+
+    def test_custom_zone_names(self):
+        type_ = timezone.TimezoneType(
+            backend='pytz',
+            impl=sa.SmallInteger(),
+            zone_names=['UTC', 'Europe/Helsinki']
+        )
+
+        assert type_.process_bind_param(u'Europe/Helsinki', None) == 1
+        assert str(type_.process_result_value(1, None)) == 'Europe/Helsinki'
+        with raises(ValueError):
+            type_.process_bind_param(u'America/Los_Angeles', None)
@@ -33,3 +33,56 @@ class TestURLType(TestCase):
         user = self.User(website=u'www.example.com')
 
         assert isinstance(user.website, url.furl)
+
+    def test_loaded_urls_are_parsed_lazily(self):
+        self.session.add(self.User(website=u'http://www.example.com/?a=1'))
+        self.session.commit()
+        self.session.expunge_all()
+
+        user = self.session.query(self.User).first()
+        assert isinstance(user.website, url.LazyURL)
+        assert not user.website.is_loaded
+        assert str(user.website) == 'http://www.example.com/?a=1'
+        assert not user.website.is_loaded
+
+        assert user.website.host == 'www.example.com'
+        assert user.website.is_loaded
+
+    def test_modifying_lazy_url(self):
+        self.session.add(self.User(website=u'http://www.example.com/'))
+        self.session.commit()
+        self.session.expunge_all()
+
+        user = self.session.query(self.User).first()
+        user.website.args['a'] = '1'
+        assert str(user.website) == 'http://www.example.com/?a=1'
+
+        user.website = url.LazyURL(user.website)
+        user.website.path = '/path'
+        self.session.commit()
+        self.session.expunge_all()
+
+        user = self.session.query(self.User).first()
+        assert str(user.website) == 'http://www.example.com/path?a=1'
+
+    def test_lazy_url_equality_and_hash(self):
+        website = url.LazyURL(u'http://www.example.com/')
+
+        assert website == url.LazyURL(u'http://www.example.com/')
+        assert website == url.furl(u'http://www.example.com/')
+        assert website != url.LazyURL(u'http://www.example.org/')
+        assert hash(website) == hash(url.LazyURL(u'http://www.example.com/'))
+
+    def test_reading_lazy_url_does_not_change_it(self):
+        raw = u'HTTP://Example.COM/a b'
+        website = url.LazyURL(raw)
+        hash_ = hash(website)
+        equal = website == url.furl(raw)
+
+        assert website.host
+        assert hash(website) == hash_
+        assert (website == url.furl(raw)) == equal
+        assert str(website) == raw
+
+        website.args['a'] = '1'
+        assert str(website) != raw
@@ -1,8 +1,9 @@
+import time
 import uuid
 
 import sqlalchemy as sa
 
-from sqlalchemy_utils import UUIDType
+from sqlalchemy_utils import uuid7, UUIDType
 from tests import TestCase
 
 
@@ -39,3 +40,96 @@ class TestUUIDType(TestCase):
 
         assert isinstance(obj.id, uuid.UUID)
         assert obj.id.bytes == identifier
+
+    def test_native_uuid_results_are_not_converted(self):
+        type_ = self.User.__table__.c.id.type
+        processor = type_.result_processor(self.engine.dialect, None)
+        identifier = uuid.uuid4()
+
+        assert processor(identifier) is identifier
+        assert processor(None) is None
+        assert processor(identifier.bytes) == identifier
+
+    def test_bind_processor(self):
+        type_ = UUIDType(binary=False)
+        processor = type_.bind_processor(self.engine.dialect)
+        identifier = uuid.uuid4()
+
+        assert processor(identifier) == identifier.hex
+        assert processor(identifier.hex) == identifier.hex
+        assert processor(None) is None
+
+
+class TestUUID7(object):
+    def test_version_and_variant(self):
+        identifier = uuid7()
+
+        assert identifier.version == 7
+        assert identifier.variant == uuid.RFC_4122
+
+    def test_timestamp(self):
+        timestamp = int(time.time() * 1000)
+        identifier = uuid7()
+
+        assert abs((identifier.int >> 80) - timestamp) < 1000
+
+    def test_uuids_are_ordered(self):
+        identifiers = [uuid7() for i in range(10000)]
+
+        assert sorted(identifiers) == identifiers
+        assert len(set(identifiers)) == len(identifiers)
+
+
+class TestOrderedUUIDType(TestCase):
+    def create_models(self):
+        class Event(self.Base):
+            __tablename__ = 'event'
+            id = sa.Column(
+                UUIDType(ordered=True),
+                default=uuid.uuid1,
+                primary_key=True
+            )
+
+        self.Event = Event
+
+    def test_timestamp_is_stored_first(self):
+        event = self.Event()
+        self.session.add(event)
+        self.session.commit()
+
+        stored = self.session.execute('SELECT id FROM event').scalar()
+        assert stored[:2] == event.id.bytes[6:8]
+        assert stored[2:4] == event.id.bytes[4:6]
+        assert stored[4:8] == event.id.bytes[0:4]
+
+        self.session.expunge_all()
+        assert self.session.query(self.Event).one().id == event.id
+
+    def test_stored_uuids_are_ordered(self):
+        type_ = UUIDType(ordered=True)
+        processor = type_.bind_processor(self.engine.dialect)
+        identifiers = [uuid.uuid1() for i in range(100)]
+
+        stored = [bytes(processor(identifier)) for identifier in identifiers]
+        assert sorted(stored) == stored
+
+
+class TestUUIDTypeOnPostgres(TestUUIDType):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def test_bind_processor(self):
+        type_ = UUIDType()
+        processor = type_.bind_processor(self.engine.dialect)
+        identifier = uuid.uuid4()
+
+        assert processor(identifier) is identifier
+        assert processor(identifier.hex) == identifier
+        assert processor(None) is None
+
+    def test_native_uuid_results_are_not_converted(self):
+        type_ = self.User.__table__.c.id.type
+        processor = type_.result_processor(self.engine.dialect, None)
+        identifier = uuid.uuid4()
+
+        assert processor(identifier) is identifier
+        assert processor(str(identifier)) == identifier
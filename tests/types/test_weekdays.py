@@ -2,7 +2,7 @@ import pytest
 import sqlalchemy as sa
 
 from sqlalchemy_utils import i18n
-from sqlalchemy_utils.primitives import WeekDays
+from sqlalchemy_utils.primitives import WeekDay, WeekDays
 from sqlalchemy_utils.types import WeekDaysType
 from tests import TestCase
 
@@ -50,3 +50,83 @@ class TestWeekDaysTypeOnPostgres(WeekDaysTypeTestCase):
 
 class TestWeekDaysTypeOnMySQL(WeekDaysTypeTestCase):
     dns = 'mysql+pymysql://travis@localhost/sqlalchemy_utils_test'
+
+
+@pytest.mark.skipif('i18n.babel is None')
+class WeekDaysTypeWithIntegerTestCase(TestCase):
+    def setup_method(self, method):
+        TestCase.setup_method(self, method)
+        i18n.get_locale = lambda: i18n.babel.Locale('en')
+
+    def create_models(self):
+        class Schedule(self.Base):
+            __tablename__ = 'schedule'
+            id = sa.Column(sa.Integer, primary_key=True)
+            working_days = sa.Column(WeekDaysType(impl=sa.SmallInteger()))
+
+        self.Schedule = Schedule
+
+    def test_parameter_processing(self):
+        self.session.add(self.Schedule(working_days='1000100'))
+        self.session.commit()
+
+        assert self.session.execute(
+            'SELECT working_days FROM schedule'
+        ).scalar() == 17
+        schedule = self.session.query(self.Schedule).first()
+        assert schedule.working_days == WeekDays('1000100')
+
+    def test_includes(self):
+        self.session.add_all([
+            self.Schedule(id=1, working_days='1100000'),
+            self.Schedule(id=2, working_days='1000001'),
+            self.Schedule(id=3, working_days='0000011')
+        ])
+        self.session.commit()
+
+        query = self.session.query(self.Schedule.id).order_by(
+            self.Schedule.id
+        )
+        assert query.filter(
+            self.Schedule.working_days.includes('1000000')
+        ).all() == [(1, ), (2, )]
+        assert query.filter(
+            self.Schedule.working_days.includes(WeekDays('1000001'))
+        ).all() == [(2, )]
+        assert query.filter(
+            self.Schedule.working_days.includes(WeekDay(6))
+        ).all() == [(2, ), (3, )]
+
+    def test_overlaps(self):
+        self.session.add_all([
+            self.Schedule(id=1, working_days='1100000'),
+            self.Schedule(id=2, working_days='0000011')
+        ])
+        self.session.commit()
+
+        query = self.session.query(self.Schedule.id).order_by(
+            self.Schedule.id
+        )
+        assert query.filter(
+            self.Schedule.working_days.overlaps('0100001')
+        ).all() == [(1, ), (2, )]
+        assert query.filter(
+            self.Schedule.working_days.overlaps('0011100')
+        ).all() == []
+
+
+class TestWeekDaysTypeWithIntegerClass(object):
+    def test_impl_class_is_instantiated(self):
+        type_ = WeekDaysType(impl=sa.SmallInteger)
+
+        assert isinstance(type_.impl, sa.SmallInteger)
+        assert type_.is_integer
+        assert type_.process_bind_param(WeekDays('1000100'), None) == 17
+
+
+class TestWeekDaysTypeWithIntegerOnSQLite(WeekDaysTypeWithIntegerTestCase):
+    dns = 'sqlite:///:memory:'
+
+
+class TestWeekDaysTypeWithIntegerOnPostgres(WeekDaysTypeWithIntegerTestCase):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'